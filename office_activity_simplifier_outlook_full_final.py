@@ -11,21 +11,22 @@ Features:
  - Periodic reminder checker that fires popup and sends email if configured
 """
 
-import calendar
 import sys
 import re
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
+from tkinter import ttk, messagebox, simpledialog
 import sqlite3
 import json
 import os
 import csv
-import subprocess
+import shutil
 import logging
-import webbrowser
-import urllib.parse
-import urllib.request
+import functools
+import contextlib
+import queue
+import threading
 from datetime import datetime, date, timedelta
+from pathlib import Path
 
 
 # ---- Persistent file logging (next to the app/exe) ----
@@ -102,10 +103,43 @@ SETTINGS_FILE = "settings.json"
 
 PRIORITIES = ["Low", "Medium", "High"]
 STATUSES = ["Pending", "In-Progress", "Done"]
+STATUS_INDEX = {s: i for i, s in enumerate(STATUSES)}
+
+# Task List columns -> (width, anchor), in display order; FULL adds the
+# description preview when the "show_description" setting is on
+COLUMN_SPECS_FULL = {
+    "id": (60, "center"),
+    "title": (300, "w"),
+    "desc": (300, "w"),
+    "due": (100, "center"),
+    "priority": (90, "center"),
+    "status": (90, "center"),
+    "responsible": (180, "w"),
+    "reminder": (120, "center"),
+}
+COLUMN_SPECS_COMPACT = {
+    "id": (60, "center"),
+    "title": (420, "w"),
+    "due": (120, "center"),
+    "priority": (100, "center"),
+    "status": (100, "center"),
+    "responsible": (180, "w"),
+    "reminder": (120, "center"),
+}
+
+# stored in PRAGMA user_version; bump whenever _init_db gains a table, column or index
+SCHEMA_VERSION = 2
+
+# when a reminder comes due; idx_tasks_reminder_target indexes this exact expression,
+# so queries must spell it the same way to use the index
+REMINDER_TARGET_SQL = "datetime(reminder_set_at, '+' || reminder_minutes || ' minutes')"
 
 def _now_iso():
     return datetime.now().isoformat(timespec="seconds")
 
+# SQL spelling of _now_iso(), for writes that only need to stamp updated_at
+SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')"
+
 def load_settings():
     if os.path.exists(SETTINGS_FILE):
         try:
@@ -132,6 +166,79 @@ def _safe_show_toast(title, msg, duration=5):
     except Exception:
         logger.exception("Toast error (ignored)")
 
+
+def _sql_fold(value):
+    """casefold() for SQL; registered on TaskDB.conn as py_fold."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# recurrence type <-> edit window combobox label
+RECURRENCE_LABELS = {"days": "Every N days", "weeks": "Every N weeks", "months": "Every N months"}
+RECURRENCE_TYPES = {label: typ for typ, label in RECURRENCE_LABELS.items()}
+
+@functools.lru_cache(maxsize=128)
+def _parse_recurrence_cached(s: str) -> tuple:
+    """
+    Parse a normalized recurrence string into (type, n). Only a handful of
+    distinct values exist, so results are memoized.
+    """
+    if s in ("none", ""):
+        return ("none", 0)
+    if ":" in s:
+        typ, n = s.split(":", 1)
+        typ = typ.strip()
+        try:
+            n = max(1, int(n))
+        except Exception:
+            n = 1
+        if typ in ("days", "weeks", "months"):
+            return (typ, n)
+    return ("none", 0)
+
+@functools.lru_cache(maxsize=4096)
+def _format_remaining(total_seconds: int) -> str:
+    """
+    Countdown text for the reminder column. Above an hour only minutes are
+    shown, so callers round down to the minute and the same few strings are
+    reused across rows and ticks.
+    """
+    if total_seconds <= 0:
+        return "Now"
+    hours, rem = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(rem, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    if minutes >= 1:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+# Outlook HTML cleanup for the Kanban details pane
+# one alternation so the body is scanned once; group 4 (<span ...>) is
+# normalised to a bare <span>, every other match is dropped
+_RE_KANBAN_CLEAN = re.compile(
+    r'(<style.*?>.*?</style>)'
+    r'|(<font[^>]*>|</font>)'
+    r'|(style="[^"]*font-(?:size|family):[^";]*;?")'
+    r'|(<span[^>]*>)',
+    re.DOTALL | re.IGNORECASE,
+)
+if os.name == "nt":
+    _KANBAN_HTML_STYLE = "font-family:Segoe UI, Arial; font-size:9pt; line-height:1.3; color:#333;"
+else:
+    _KANBAN_HTML_STYLE = "font-family:Arial; font-size:11px; line-height:1.3; color:#333;"
+
+def _kanban_clean_repl(m):
+    return "<span>" if m.lastindex == 4 else ""
+
+def _clean_kanban_html(html):
+    """Strip Outlook styling from an email body and wrap it in the pane's font."""
+    clean = _RE_KANBAN_CLEAN.sub(_kanban_clean_repl, html or "")
+    return f"<div style='{_KANBAN_HTML_STYLE}'>{clean}</div>"
+
 # -------------------- Database --------------------
 
 def normalize_subject(subj: str) -> str:
@@ -148,6 +255,21 @@ def normalize_subject(subj: str) -> str:
                 changed = True
     return subj
 class TaskDB:
+    # fixed statement text so the connection's statement cache reuses the compiled form
+    SNOOZE_SQL = "UPDATE tasks SET reminder_minutes=?, reminder_set_at=?, reminder_sent_at=NULL WHERE id=?"
+    DISMISS_SQL = "UPDATE tasks SET reminder_sent_at=? WHERE id=?"
+    # Task List heading -> ORDER BY expression for fetch(order_by=...)
+    SORT_COLUMNS = {
+        "id": "id",
+        "title": "title COLLATE NOCASE",
+        "desc": "description COLLATE NOCASE",
+        "due": "due_date",
+        "priority": "CASE lower(priority) WHEN 'high' THEN 0 WHEN 'medium' THEN 1 WHEN 'low' THEN 2 END",
+        "status": "status COLLATE NOCASE",
+        "responsible": "(SELECT coalesce(nullif(c.name, ''), c.email) FROM contacts c WHERE c.id = tasks.responsible_id) COLLATE NOCASE",
+        "reminder": REMINDER_TARGET_SQL,
+    }
+
     def update_task(self, task_id, **fields):
         keys = []
         values = []
@@ -155,8 +277,7 @@ class TaskDB:
             keys.append(f"{k}=?")
             values.append(v)
         values.append(task_id)
-        sql = f"UPDATE tasks SET {', '.join(keys)}, updated_at=? WHERE id=?"
-        values.insert(-1, _now_iso())
+        sql = f"UPDATE tasks SET {', '.join(keys)}, updated_at={SQL_NOW} WHERE id=?"
         with self.conn:
             self.conn.execute(sql, values)
             
@@ -165,47 +286,118 @@ class TaskDB:
         cur.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
         return cur.fetchone()
 
+    def get_fields(self, task_id, *columns):
+        """
+        Return a Row with only `columns` of one task, or None. Column names come
+        from code, so each call site is one fixed statement the cache keeps prepared.
+        """
+        return self._cur.execute(f"SELECT {', '.join(columns)} FROM tasks WHERE id=?", (task_id,)).fetchone()
+
+    def set_reminder_mail_entryid(self, task_id, entry_id):
+        with self.conn:
+            self.conn.execute("UPDATE tasks SET reminder_mail_entryid=? WHERE id=?", (entry_id, task_id))
+
     def mark_future(self, task_id):
         with self.conn:
             self.conn.execute(
-                "UPDATE tasks SET is_future=1, updated_at=? WHERE id=?",
-                (_now_iso(), task_id)
+                f"UPDATE tasks SET is_future=1, updated_at={SQL_NOW} WHERE id=?",
+                (task_id,)
             )
 
     def pull_from_future(self, task_id):
         with self.conn:
             self.conn.execute(
-                "UPDATE tasks SET is_future=0, updated_at=? WHERE id=?",
-                (_now_iso(), task_id)
+                f"UPDATE tasks SET is_future=0, updated_at={SQL_NOW} WHERE id=?",
+                (task_id,)
             )
 
-    def fetch_future_tasks(self):
+    def fetch_future_tasks(self, text=None, priority=None, status=None, due=None):
+        where, params = self._filter_clause(text, priority, status, due)
         cur = self.conn.cursor()
         cur.execute("""
             SELECT *
             FROM tasks
             WHERE deleted_at IS NULL
             AND is_future = 1
-            AND status != 'Done'
+            AND status != 'Done'""" + where + """
             ORDER BY due_date IS NULL, due_date ASC
-        """)
+        """, params)
         return cur.fetchall()
 
 
     def __init__(self, path=DB_FILE):
-        self.conn = sqlite3.connect(path)
+        # the filter bar builds many WHERE variants; keep all of them prepared
+        self.conn = sqlite3.connect(path, cached_statements=256)
         # return rows as mapping
         self.conn.row_factory = sqlite3.Row
         # Improve durability / concurrency
         try:
             self.conn.execute("PRAGMA journal_mode=WAL;")
             self.conn.execute("PRAGMA foreign_keys=ON;")
+            # WAL + NORMAL only fsyncs at checkpoints: a power cut can lose the
+            # last few commits, but the database itself stays consistent
+            self.conn.execute("PRAGMA synchronous=NORMAL;")
+            self.conn.execute("PRAGMA temp_store=MEMORY;")
+            self.conn.execute("PRAGMA cache_size=-20000;")
+            self.conn.execute("PRAGMA mmap_size=268435456;")
+            self.conn.execute("PRAGMA wal_autocheckpoint=1000;")
         except Exception:
             pass
+        # id -> (name, email) and id -> "Name <email>" label, built lazily and
+        # dropped on contact changes
+        self._contact_map = None
+        self._contact_labels = None
+        self._contact_choices = None
+        # shared read cursor for the hot refresh/lookup paths; every use
+        # consumes its result before returning, so sharing it is safe
+        self._cur = self.conn.cursor()
+        # LIKE only folds ASCII case; the filter bar matches through py_fold so
+        # "über" still finds "Über..." as the old Python-side filter did
+        self.conn.create_function("py_fold", 1, _sql_fold, deterministic=True)
+        # JSON1 + RETURNING let append_attachment() update the list in one statement
+        self._has_json1 = False
+        try:
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                self.conn.execute("SELECT json_insert('[]', '$[#]', 1)").fetchone()
+                self._has_json1 = True
+        except Exception:
+            self._has_json1 = False
         self._init_db()
+        # the timer-driven reminder pollers read through their own read-only
+        # connection, so they never run inside a write transaction on self.conn;
+        # their cursor returns plain tuples, which the hot loops unpack by position
+        self.conn_r = None
+        if path != ":memory:":
+            try:
+                uri = Path(path).resolve().as_uri() + "?mode=ro"
+                self.conn_r = sqlite3.connect(uri, uri=True)
+            except Exception:
+                logger.exception("Could not open read-only connection; sharing the writer")
+                self.conn_r = None
+        self._rcur = (self.conn_r or self.conn).cursor()
+        self._rcur.row_factory = None
+
+    def close(self):
+        """Refresh planner statistics and close both connections."""
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except Exception:
+            pass
+        for conn in (self.conn_r, self.conn):
+            try:
+                if conn is not None:
+                    conn.close()
+            except Exception:
+                pass
 
     def _init_db(self):
         cur = self.conn.cursor()
+        # an up-to-date database skips the schema reflection and migrations entirely
+        try:
+            if cur.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return
+        except Exception:
+            pass
         # Primary tasks table
         cur.execute("""
             CREATE TABLE IF NOT EXISTS tasks(
@@ -261,40 +453,87 @@ class TaskDB:
         except Exception:
             pass
 
-        cols_to_ensure = [
-            "outlook_id",
-            "outlook_storeid",
-            "outlook_received_time",
-            "outlook_sender",
-            "progress_log",
-            "attachments",
-            "reminder_minutes",
-            "reminder_set_at",
-            "reminder_sent_at",
-            "deleted_at",
-            "recurrence",
-            "responsible_id",
-            "reminder_email_body",
-            "reminder_mail_entryid"
-        ]
-        for col in cols_to_ensure:
+        # text is fine for migration
+        cols_to_ensure = {
+            "outlook_id": "TEXT",
+            "outlook_storeid": "TEXT",
+            "outlook_received_time": "TEXT",
+            "outlook_sender": "TEXT",
+            "progress_log": "TEXT",
+            "attachments": "TEXT",
+            "reminder_minutes": "TEXT",
+            "reminder_set_at": "TEXT",
+            "reminder_sent_at": "TEXT",
+            "deleted_at": "TEXT",
+            "recurrence": "TEXT",
+            "responsible_id": "TEXT",
+            "reminder_email_body": "TEXT",
+            "reminder_mail_entryid": "TEXT",
+            "is_future": "INTEGER DEFAULT 0",
+        }
+        for col, decl in cols_to_ensure.items():
             try:
                 if col not in existing_cols:
-                    # text is fine for migration
-                    cur.execute(f"ALTER TABLE tasks ADD COLUMN {col} TEXT;")
+                    cur.execute(f"ALTER TABLE tasks ADD COLUMN {col} {decl};")
             except sqlite3.OperationalError:
                 pass
             except Exception:
                 pass
+
+        # indexes backing the filter bar, Outlook dedup and Trash queries
         try:
-            cur.execute("PRAGMA table_info(tasks)")
-            cols = [r["name"] for r in cur.fetchall()]
-            if "is_future" not in cols:
-                cur.execute("ALTER TABLE tasks ADD COLUMN is_future INTEGER DEFAULT 0")
+            # status/due lookups only ever look at live rows; replaces the old full index
+            cur.execute("DROP INDEX IF EXISTS idx_tasks_status_due")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_live_status_due ON tasks(status, due_date) WHERE deleted_at IS NULL")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority)")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_outlook_id ON tasks(outlook_id)")
+            # due-today / overdue lookups only ever look at live rows
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(due_date) WHERE deleted_at IS NULL")
+            # partial: only trashed rows are indexed, so it stays small
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_deleted_at ON tasks(deleted_at) WHERE deleted_at IS NOT NULL")
+            # the reminder checker polls every few seconds: index the due time of open
+            # reminders (replaces the earlier index on reminder_set_at alone)
+            cur.execute("DROP INDEX IF EXISTS idx_tasks_reminder_pending")
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_tasks_reminder_target ON tasks({REMINDER_TARGET_SQL}) "
+                "WHERE reminder_minutes IS NOT NULL AND reminder_set_at IS NOT NULL AND status != 'Done'"
+            )
+        except Exception:
+            pass
+        # contact emails are unique case-insensitively; older databases may already
+        # hold duplicates, in which case a plain index still serves the lookup
+        try:
+            cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email COLLATE NOCASE)")
+        except sqlite3.IntegrityError:
+            try:
+                cur.execute("CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email COLLATE NOCASE)")
+            except Exception:
+                pass
+        except Exception:
+            pass
+        # give the planner statistics once; PRAGMA optimize on exit keeps them fresh
+        try:
+            if not cur.execute("SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'").fetchone():
+                cur.execute("ANALYZE")
+        except Exception:
+            pass
+        try:
+            cur.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
         except Exception:
             pass
         self.conn.commit()
 
+    @contextlib.contextmanager
+    def _write_txn(self):
+        """
+        Like `with self.conn:`, but takes the write lock up front (BEGIN IMMEDIATE)
+        so a read-then-write batch never has to upgrade its lock halfway through.
+        """
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+        with self.conn:
+            yield self.conn
+
     # contact helpers
     def add_contact(self, name, email):
         now = _now_iso()
@@ -303,111 +542,175 @@ class TaskDB:
                 "INSERT INTO contacts(name, email, created_at) VALUES(?,?,?)",
                 (name, email, now)
             )
+        self._contact_map = None
+        self._contact_labels = None
+        self._contact_choices = None
 
     def get_contacts(self):
         cur = self.conn.cursor()
         cur.execute("SELECT id, name, email FROM contacts ORDER BY name")
         return cur.fetchall()
 
+    def get_contact_map(self):
+        """
+        Return a dict of contact id -> (name, email), loaded with one query
+        and cached until a contact is added.
+        """
+        if self._contact_map is None:
+            # plain tuples: unpacked by position, no per-column Row lookups
+            cur = self.conn.cursor()
+            cur.row_factory = None
+            try:
+                rows = cur.execute("SELECT id, name, email FROM contacts").fetchall()
+            except Exception:
+                return {}
+            self._contact_map = {cid: (name or "", email or "") for cid, name, email in rows}
+        return self._contact_map
+
+    def get_contact_labels(self):
+        """Return a dict of contact id -> display label, derived from get_contact_map()."""
+        if self._contact_labels is None:
+            self._contact_labels = {
+                cid: (f"{name} <{email}>" if name else email)
+                for cid, (name, email) in self.get_contact_map().items()
+            }
+        return self._contact_labels
+
+    def get_contact_choices(self):
+        """
+        Return (labels sorted by contact name, label -> id) for the Responsible
+        dropdown; cached with the contact map, so opening an editor costs no query.
+        """
+        if self._contact_choices is None:
+            contacts = self.get_contact_map()
+            labels = self.get_contact_labels()
+            ids = sorted(contacts, key=lambda cid: contacts[cid][0])
+            choices = [labels[cid] for cid in ids]
+            self._contact_choices = (choices, {labels[cid]: cid for cid in ids})
+        return self._contact_choices
+
+    def get_contact_email(self, contact_id):
+        if not contact_id:
+            return ""
+        try:
+            return self.get_contact_map().get(int(contact_id), ("", ""))[1]
+        except Exception:
+            return ""
+
     def get_contact_label(self, contact_id):
         if not contact_id:
             return ""
         try:
-            cur = self.conn.cursor()
-            cur.execute("SELECT name, email FROM contacts WHERE id=?", (int(contact_id),))
-            r = cur.fetchone()
-            if not r:
-                return ""
-            name = r["name"] or ""
-            email = r["email"] or ""
-            return f"{name} <{email}>" if name else email
+            return self.get_contact_labels().get(int(contact_id), "")
         except Exception:
             return ""
 
-    def bulk_add_contacts_from_file(self, path):
+    @staticmethod
+    def _iter_contact_rows(path):
         """
-        Accepts a .csv or .xlsx file containing header columns 'name' and 'email'.
-        Tries pandas if available for Excel; falls back to csv for .csv files or openpyxl fallback.
+        Yield (name, email) pairs from a .csv or .xlsx contacts file. Reading
+        stops quietly at the first unreadable row, keeping what came before.
         """
-        if not os.path.exists(path):
-            return 0
-        added = 0
         ext = os.path.splitext(path)[1].lower()
-        rows = []
         try:
-            if ext in (".xls", ".xlsx"):
+            if ext == ".xlsx":
+                # read-only openpyxl streams rows instead of loading the sheet
+                from openpyxl import load_workbook  # type: ignore
+                wb = load_workbook(path, read_only=True, data_only=True)
                 try:
-                    import pandas as pd  # type: ignore
-                    df = pd.read_excel(path)
-                    for _, r in df.iterrows():
-                        name = str(r.get("name") or r.get("Name") or "").strip()
-                        email = str(r.get("email") or r.get("Email") or "").strip()
-                        if email:
-                            rows.append((name or email, email))
-                except Exception:
-                    # fallback: try openpyxl minimal read (no pandas)
-                    try:
-                        from openpyxl import load_workbook  # type: ignore
-                        wb = load_workbook(path, read_only=True, data_only=True)
-                        ws = wb.active
-                        headers = [str(c.value).strip().lower() if c.value else "" for c in next(ws.rows)]
-                        name_idx = None
-                        email_idx = None
-                        for i, h in enumerate(headers):
-                            if h in ("name", "full name", "fullname"):
-                                name_idx = i
-                            if h in ("email", "email id", "emailid", "email_address"):
-                                email_idx = i
-                        for row in ws.iter_rows(min_row=2, values_only=True):
-                            name = row[name_idx] if name_idx is not None else None
-                            email = row[email_idx] if email_idx is not None else None
-                            if email:
-                                rows.append((str(name or "").strip() or str(email).strip(), str(email).strip()))
-                    except Exception:
-                        pass
+                    ws = wb.active
+                    rows = ws.iter_rows(values_only=True)
+                    headers = [str(v).strip().lower() if v else "" for v in next(rows, ())]
+                    name_idx = None
+                    email_idx = None
+                    for i, h in enumerate(headers):
+                        if h in ("name", "full name", "fullname"):
+                            name_idx = i
+                        if h in ("email", "email id", "emailid", "email_address"):
+                            email_idx = i
+                    if email_idx is None:
+                        return
+                    for row in rows:
+                        email = str(row[email_idx] or "").strip() if email_idx < len(row) else ""
+                        if not email:
+                            continue
+                        name = str(row[name_idx] or "").strip() if name_idx is not None and name_idx < len(row) else ""
+                        yield name or email, email
+                finally:
+                    wb.close()
+            elif ext == ".xls":
+                # legacy .xls is beyond openpyxl; pandas (with xlrd) is the only reader
+                import pandas as pd  # type: ignore
+                df = pd.read_excel(path)
+                for r in df.to_dict("records"):
+                    name = str(r.get("name") or r.get("Name") or "").strip()
+                    email = str(r.get("email") or r.get("Email") or "").strip()
+                    if email:
+                        yield name or email, email
             else:
-                # csv fallback
                 with open(path, newline="", encoding="utf-8-sig") as f:
-                    reader = csv.DictReader(f)
-                    for r in reader:
+                    for r in csv.DictReader(f):
                         name = (r.get("name") or r.get("Name") or "").strip()
                         email = (r.get("email") or r.get("Email") or "").strip()
                         if email:
-                            rows.append((name or email, email))
+                            yield name or email, email
         except Exception:
-            pass
+            logger.exception("Could not read contacts from %s", path)
 
-        # insert unique emails only
-        cur = self.conn.cursor()
-        for name, email in rows:
-            try:
-                cur.execute("SELECT 1 FROM contacts WHERE lower(email)=lower(?)", (email,))
-                if cur.fetchone():
-                    continue
-                self.add_contact(name, email)
-                added += 1
-            except Exception:
-                continue
+    def bulk_add_contacts_from_file(self, path):
+        """
+        Accepts a .csv or .xlsx (or legacy .xls, via pandas) file containing header
+        columns 'name' and 'email'; rows are streamed straight into the insert.
+        """
+        if not os.path.exists(path):
+            return 0
+        rows = self._iter_contact_rows(path)
+
+        # insert unique emails only, in one transaction; the NOT EXISTS probe uses
+        # idx_contacts_email and also catches duplicates within the file itself
+        now = _now_iso()
+        before = self.conn.total_changes
+        try:
+            with self._write_txn():
+                self.conn.executemany(
+                    "INSERT INTO contacts(name, email, created_at) SELECT ?, ?, ? "
+                    "WHERE NOT EXISTS (SELECT 1 FROM contacts WHERE email = ? COLLATE NOCASE)",
+                    ((name, email, now, email) for name, email in rows),
+                )
+        except Exception:
+            logger.exception("Contact import failed")
+            return 0
+        added = self.conn.total_changes - before
+        if added:
+            self._contact_map = None
+            self._contact_labels = None
+            self._contact_choices = None
         return added
 
     # tasks methods
     def add(self, title, description, due_date, priority, status="Pending",
         outlook_id=None, reminder_minutes=None, reminder_set_at=None,
-        recurrence=None, responsible_id=None, reminder_email_body=None):
-
+        recurrence=None, responsible_id=None, reminder_email_body=None,
+        attachments=None, progress_log=None):
+        """
+        Insert a task and return its new id. `attachments` is the JSON-encoded
+        file list and `progress_log` the initial log text, written in the same
+        INSERT so a new task costs a single commit.
+        """
         now = _now_iso()
         done_at = now if status == "Done" else None
 
         with self.conn:
-            self.conn.execute(
+            cur = self.conn.execute(
                 """INSERT INTO tasks(
                     title, description, due_date, priority, status,
                     created_at, updated_at, done_at,
                     outlook_id,
                     reminder_minutes, reminder_set_at, reminder_sent_at,
-                    recurrence, responsible_id, reminder_email_body
+                    recurrence, responsible_id, reminder_email_body,
+                    attachments, progress_log
                 )
-                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
                 (
                     title,
                     description,
@@ -423,64 +726,239 @@ class TaskDB:
                     None,
                     recurrence,
                     responsible_id,
-                    reminder_email_body
+                    reminder_email_body,
+                    attachments,
+                    progress_log
                 )
             )
+        return cur.lastrowid
 
-    def update(self, task_id, title, description, due_date, priority, status, reminder_minutes=None, reminder_set_at=None, recurrence=None, responsible_id=None, reminder_email_body=None):
+    def update(self, task_id, title, description, due_date, priority, status, reminder_minutes=None, reminder_set_at=None, recurrence=None, responsible_id=None, reminder_email_body=None, add_attachments=None):
+        """
+        Rewrite a task from the edit form. `add_attachments` (paths) are appended
+        to the attachments stored at write time, in the same transaction.
+        """
+        now = _now_iso()
+        done_at = now if status == "Done" else None
+        # If caller passes reminder_* explicitly, update them; otherwise leave as-is
+        if reminder_minutes is None and reminder_set_at is None and recurrence is None and responsible_id is None and reminder_email_body is None:
+            sql = """UPDATE tasks SET title=?, description=?, due_date=?, priority=?, 
+                       status=?, updated_at=?, done_at=?"""
+            params = [title, description, due_date, priority, status, now, done_at]
+        else:
+            sql = """UPDATE tasks SET title=?, description=?, due_date=?, priority=?, 
+                       status=?, updated_at=?, done_at=?, reminder_minutes=?, reminder_set_at=?, recurrence=?, responsible_id=?, reminder_email_body=?"""
+            params = [title, description, due_date, priority, status, now, done_at, reminder_minutes, reminder_set_at, recurrence, responsible_id, reminder_email_body]
+        with self._write_txn():
+            # attachments ride along in the same statement; reading the current
+            # list under the write lock keeps files attached elsewhere meanwhile
+            if add_attachments:
+                sql += ", attachments=?"
+                params.append(json.dumps(self.get_attachments(task_id) + list(add_attachments)))
+            params.append(task_id)
+            self.conn.execute(sql + " WHERE id=?", params)
+
+    def update_status(self, task_id, status):
+        """Change only the status (and done_at) of a task."""
         now = _now_iso()
         done_at = now if status == "Done" else None
         with self.conn:
-            # If caller passes reminder_* explicitly, update them; otherwise leave as-is
-            if reminder_minutes is None and reminder_set_at is None and recurrence is None and responsible_id is None and reminder_email_body is None:
-                self.conn.execute(
-                    """UPDATE tasks SET title=?, description=?, due_date=?, priority=?, 
-                       status=?, updated_at=?, done_at=? WHERE id=?""",
-                    (title, description, due_date, priority, status, now, done_at, task_id),
-                )
-            else:
-                self.conn.execute(
-                    """UPDATE tasks SET title=?, description=?, due_date=?, priority=?, 
-                       status=?, updated_at=?, done_at=?, reminder_minutes=?, reminder_set_at=?, recurrence=?, responsible_id=?, reminder_email_body=? WHERE id=?""",
-                    (title, description, due_date, priority, status, now, done_at, reminder_minutes, reminder_set_at, recurrence, responsible_id, reminder_email_body, task_id),
-                )
+            self.conn.execute(
+                "UPDATE tasks SET status=?, updated_at=?, done_at=? WHERE id=?",
+                (status, now, done_at, task_id),
+            )
+
+    def update_description(self, task_id, description):
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE tasks SET description=?, updated_at={SQL_NOW} WHERE id=?",
+                (description, task_id),
+            )
 
     def update_progress(self, task_id, progress_log):
-        now = _now_iso()
         with self.conn:
             self.conn.execute(
-                "UPDATE tasks SET progress_log=?, updated_at=? WHERE id=?",
-                (progress_log, now, task_id),
+                f"UPDATE tasks SET progress_log=?, updated_at={SQL_NOW} WHERE id=?",
+                (progress_log, task_id),
             )
 
-    def delete(self, task_id):
+    def prepend_progress(self, task_id, entry):
+        """
+        Prepend one entry to a task's progress log in a single transaction
+        and return the resulting log text.
+        """
+        sql = f"UPDATE tasks SET progress_log = ? || COALESCE(progress_log, ''), updated_at={SQL_NOW} WHERE id=?"
         with self.conn:
-            self.conn.execute("DELETE FROM tasks WHERE id=?", (task_id,))
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                row = self.conn.execute(sql + " RETURNING progress_log", (entry, task_id)).fetchone()
+            else:
+                self.conn.execute(sql, (entry, task_id))
+                row = self.conn.execute("SELECT progress_log FROM tasks WHERE id=?", (task_id,)).fetchone()
+        return (row["progress_log"] if row else None) or ""
+
+    def delete(self, task_id):
+        self.delete_many([task_id])
 
     def soft_delete(self, task_id):
-        now = _now_iso()
-        with self.conn:
-            self.conn.execute("UPDATE tasks SET deleted_at=?, updated_at=? WHERE id=?", (now, now, task_id))
+        self.soft_delete_many([task_id])
 
     def restore(self, task_id):
+        self.restore_many([task_id])
+
+    # multi-row variants: one transaction (one commit) for the whole selection
+    def delete_many(self, task_ids):
         with self.conn:
-            self.conn.execute("UPDATE tasks SET deleted_at=NULL, updated_at=? WHERE id=?", (_now_iso(), task_id))
+            self.conn.executemany("DELETE FROM tasks WHERE id=?", [(i,) for i in task_ids])
 
-    def purge_deleted(self, older_than_iso=None):
+    def soft_delete_many(self, task_ids):
+        now = _now_iso()
         with self.conn:
-            if older_than_iso:
-                self.conn.execute("DELETE FROM tasks WHERE deleted_at IS NOT NULL AND deleted_at < ?", (older_than_iso,))
-            else:
-                self.conn.execute("DELETE FROM tasks WHERE deleted_at IS NOT NULL")
+            self.conn.executemany(
+                "UPDATE tasks SET deleted_at=?, updated_at=? WHERE id=?",
+                [(now, now, i) for i in task_ids],
+            )
 
-    def fetch(self):
-        cur = self.conn.cursor()
+    def restore_many(self, task_ids):
+        with self.conn:
+            self.conn.executemany(
+                f"UPDATE tasks SET deleted_at=NULL, updated_at={SQL_NOW} WHERE id=?",
+                [(i,) for i in task_ids],
+            )
+
+    def purge_deleted(self, older_than_iso=None, chunk=500):
+        """
+        Permanently delete trashed tasks (optionally only those trashed before
+        `older_than_iso`) in chunks of `chunk` rows, one commit per chunk, so a
+        large Trash doesn't become one long transaction. Returns the count.
+        """
+        where = "deleted_at IS NOT NULL"
+        params = ()
+        if older_than_iso:
+            where += " AND deleted_at < ?"
+            params = (older_than_iso,)
+        sql = f"DELETE FROM tasks WHERE id IN (SELECT id FROM tasks WHERE {where} LIMIT ?)"
+        total = 0
+        while True:
+            with self.conn:
+                n = self.conn.execute(sql, params + (chunk,)).rowcount
+            total += n
+            if n < chunk:
+                return total
+
+    def get_details(self, task_id):
+        """Return description, progress_log, outlook_id and attachments for one task in a single SELECT."""
+        return self._cur.execute(
+            "SELECT description, progress_log, outlook_id, attachments FROM tasks WHERE id=?", (task_id,)
+        ).fetchone()
+
+    def get_attachments(self, task_id):
+        """Return the task's attachment paths as a list ([] if none or unreadable)."""
+        row = self._cur.execute("SELECT attachments FROM tasks WHERE id=?", (task_id,)).fetchone()
+        if not row or not row["attachments"]:
+            return []
+        try:
+            return json.loads(row["attachments"])
+        except Exception:
+            return []
+
+    def append_attachment(self, task_id, path):
+        """
+        Append one file path to a task's attachments JSON and return the new list.
+        Uses json_insert when available so the blob is never decoded in Python.
+        """
+        if self._has_json1:
+            try:
+                with self.conn:
+                    row = self.conn.execute(
+                        "UPDATE tasks SET attachments = json_insert(COALESCE(attachments, '[]'), '$[#]', ?) "
+                        "WHERE id=? RETURNING attachments",
+                        (path, task_id)
+                    ).fetchone()
+                return json.loads(row["attachments"]) if row else []
+            except Exception:
+                # e.g. malformed JSON in the column: fall through and rewrite it
+                logger.exception("json_insert append failed; using fallback")
+        # read-modify-write: hold the write lock from the read on, so another
+        # writer (a second app instance) can't slip an append in between
+        with self._write_txn():
+            files = self.get_attachments(task_id)
+            files.append(path)
+            self.conn.execute("UPDATE tasks SET attachments=? WHERE id=?", (json.dumps(files), task_id))
+        return files
+
+    @staticmethod
+    def _filter_clause(text=None, priority=None, status=None, due=None, show_completed=True):
+        """
+        Build extra WHERE conditions for the global filter bar.
+        Returns (sql, params) where sql is either "" or starts with " AND ".
+        """
+        clauses = []
+        params = []
+        if text:
+            needle = text.casefold()
+            clauses.append("(instr(py_fold(title), ?) > 0 OR instr(py_fold(description), ?) > 0)")
+            params.extend([needle, needle])
+        if priority:
+            clauses.append("priority = ?")
+            params.append(priority)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if due:
+            clauses.append("due_date = ?")
+            params.append(due)
+        if not show_completed:
+            clauses.append("(status IS NULL OR lower(trim(status)) <> 'done')")
+        if not clauses:
+            return "", params
+        return " AND " + " AND ".join(clauses), params
+
+    def fetch(self, text=None, priority=None, status=None, due=None, show_completed=True,
+              order_by=None, desc=False):
+        """
+        Live, non-future tasks matching the filter bar. `order_by` is a key of
+        SORT_COLUMNS; rows without a value for it sort last in either direction.
+        """
+        where, params = self._filter_clause(text, priority, status, due, show_completed)
+        expr = self.SORT_COLUMNS.get(order_by)
+        if expr:
+            order = f"({expr}) IS NULL, {expr} {'DESC' if desc else 'ASC'}, id"
+        else:
+            order = "due_date IS NULL, due_date ASC, priority DESC"
+        cur = self._cur
         cur.execute("""
             SELECT * FROM tasks
             WHERE deleted_at IS NULL
+            AND (is_future IS NULL OR is_future = 0)""" + where + """
+            ORDER BY """ + order, params)
+        return cur.fetchall()
+
+    def fetch_iter(self):
+        """
+        Yield (title, description, due_date, priority, status) tuples for the
+        CSV export, same rows/order as fetch(), without building a list.
+        Uses its own cursor since the caller iterates lazily.
+        """
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        cur.execute("""
+            SELECT title, description, due_date, priority, status FROM tasks
+            WHERE deleted_at IS NULL
             AND (is_future IS NULL OR is_future = 0)
             ORDER BY due_date IS NULL, due_date ASC, priority DESC
         """)
+        yield from cur
+
+    def fetch_kanban(self, text=None, priority=None, status=None, due=None, show_completed=True):
+        where, params = self._filter_clause(text, priority, status, due, show_completed)
+        cur = self._cur
+        cur.execute("""
+            SELECT id, title, due_date, priority, status, responsible_id
+            FROM tasks
+            WHERE deleted_at IS NULL
+            AND (is_future IS NULL OR is_future = 0)""" + where + """
+            ORDER BY due_date IS NULL, due_date ASC, priority DESC
+        """, params)
         return cur.fetchall()
 
     def fetch_by_status(self, status):
@@ -500,48 +978,133 @@ class TaskDB:
         cur.execute("SELECT * FROM tasks WHERE status!='Done' AND due_date IS NOT NULL AND due_date < ? AND deleted_at IS NULL", (today,))
         return cur.fetchall()
 
-    def fetch_deleted(self):
+    def fetch_reminders(self):
+        """Return (id, reminder_minutes, reminder_set_at, reminder_sent_at) tuples for live tasks with a reminder set."""
+        return self._rcur.execute("""
+            SELECT id, reminder_minutes, reminder_set_at, reminder_sent_at
+            FROM tasks
+            WHERE deleted_at IS NULL AND reminder_minutes IS NOT NULL AND reminder_minutes != ''
+            AND reminder_set_at IS NOT NULL
+        """).fetchall()
+
+    def fetch_due_reminders(self, now=None):
+        """
+        Return (id, title, description) tuples for open tasks whose reminder
+        (reminder_set_at + reminder_minutes) is due at `now` and has not been sent
+        since it came due. The due-time arithmetic runs in SQLite; rows with
+        malformed timestamps or minutes are skipped.
+        """
+        now = now or datetime.now()
+        target = REMINDER_TARGET_SQL
+        # range scan on idx_tasks_reminder_target
+        return self._rcur.execute(f"""
+            SELECT id, title, description
+            FROM tasks
+            WHERE reminder_minutes IS NOT NULL AND reminder_minutes != '' AND reminder_set_at IS NOT NULL
+            AND status != 'Done'
+            AND {target} <= ?
+            AND (datetime(reminder_sent_at) IS NULL OR datetime(reminder_sent_at) < {target})
+        """, (now.strftime("%Y-%m-%d %H:%M:%S"),)).fetchall()
+
+    def snooze_reminders(self, snoozes):
+        """
+        Restart reminders in one transaction. `snoozes` maps task_id ->
+        (minutes, ts): each reminder fires `minutes` after its `ts`.
+        """
+        if not snoozes:
+            return
+        with self._write_txn():
+            self.conn.executemany(
+                self.SNOOZE_SQL,
+                ((int(minutes), ts, task_id) for task_id, (minutes, ts) in snoozes.items())
+            )
+
+    def dismiss_reminders(self, dismissals):
+        """Mark reminders handled in one transaction; `dismissals` maps task_id -> ts."""
+        if not dismissals:
+            return
+        with self._write_txn():
+            self.conn.executemany(self.DISMISS_SQL, ((ts, task_id) for task_id, ts in dismissals.items()))
+
+    def fetch_deleted(self, text=None, priority=None, status=None, due=None):
+        where, params = self._filter_clause(text, priority, status, due)
         cur = self.conn.cursor()
-        cur.execute("SELECT * FROM tasks WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC")
+        cur.execute("SELECT * FROM tasks WHERE deleted_at IS NOT NULL" + where + " ORDER BY deleted_at DESC", params)
         return cur.fetchall()
 
+    def get_outlook_ids(self):
+        """Return the set of Outlook EntryIDs already stored on tasks."""
+        cur = self.conn.cursor()
+        cur.execute("SELECT outlook_id FROM tasks WHERE outlook_id IS NOT NULL")
+        return {r[0] for r in cur.fetchall()}
+
+    def find_existing_outlook_keys(self, outlook_ids, titles, chunk=450):
+        """
+        Return (ids, titles) already present in tasks: the subset of `outlook_ids`
+        stored as outlook_id, and the lower(title) values matching lower() of any
+        of `titles`. Queries run in chunks to stay under SQLite's bound-variable limit.
+        """
+        outlook_ids = [i for i in outlook_ids if i]
+        titles = [t for t in titles if t]
+        found_ids = set()
+        found_titles = set()
+        cur = self.conn.cursor()
+        for start in range(0, len(outlook_ids), chunk):
+            part = outlook_ids[start:start + chunk]
+            cur.execute(
+                f"SELECT outlook_id FROM tasks WHERE outlook_id IN ({','.join('?' * len(part))})",
+                part,
+            )
+            found_ids.update(r[0] for r in cur.fetchall())
+        for start in range(0, len(titles), chunk):
+            part = titles[start:start + chunk]
+            cur.execute(
+                f"SELECT DISTINCT lower(title) FROM tasks WHERE lower(title) IN ({','.join(['lower(?)'] * len(part))})",
+                part,
+            )
+            found_titles.update(r[0] for r in cur.fetchall())
+        return found_ids, found_titles
+
     def bulk_add(self, rows):
+        """
+        Insert task dicts in a single transaction and return how many were added.
+        `rows` may be any iterable (e.g. a generator over a CSV reader); it is
+        streamed straight into one executemany, so memory stays bounded.
+        """
         now = _now_iso()
-        with self.conn:
-            for r in rows:
-                done_at = now if r.get("status") == "Done" else None
-                ###
-                self.conn.execute(
-                    """INSERT INTO tasks(
+
+        def _params(r):
+            return (
+                r.get("title"),
+                r.get("description"),
+                r.get("due_date"),
+                r.get("priority", "Medium"),
+                r.get("status", "Pending"),
+                now,
+                now,
+                now if r.get("status") == "Done" else None,
+                r.get("outlook_id"),
+                r.get("outlook_storeid"),
+                r.get("outlook_received_time"),
+                r.get("outlook_sender"),
+                r.get("progress_log", ""),
+                r.get("attachments"),
+                r.get("recurrence"),
+            )
+
+        with self._write_txn():
+            cur = self.conn.executemany(
+                """INSERT INTO tasks(
                         title, description, due_date, priority, status,
                         created_at, updated_at, done_at,
                         outlook_id, outlook_storeid, outlook_received_time, outlook_sender,
-                        progress_log, attachments,
-                        reminder_minutes, reminder_set_at, reminder_sent_at, deleted_at, recurrence
+                        progress_log, attachments, recurrence
                     )
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                    (
-                        r.get("title"),
-                        r.get("description"),
-                        r.get("due_date"),
-                        r.get("priority", "Medium"),
-                        r.get("status", "Pending"),
-                        now,
-                        now,
-                        done_at,
-                        r.get("outlook_id"),
-                        r.get("outlook_storeid"),
-                        r.get("outlook_received_time"),
-                        r.get("outlook_sender"),
-                        r.get("progress_log", ""),
-                        r.get("attachments"),
-                        None,
-                        None,
-                        None,
-                        None,
-                        r.get("recurrence")
-                    ),
-                )
+                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+                (_params(r) for r in rows),
+            )
+        return max(cur.rowcount, 0)
+
     def mark_done(self, task_id):
         now = _now_iso()
         with self.conn:
@@ -552,11 +1115,12 @@ class TaskDB:
 
 # -------------------- App --------------------
 class TaskApp(tk.Tk):
+    # wrapper tags stripped from descriptions for the Task List preview
+    _PREVIEW_RE = re.compile(r"</?(?:body|html)>")
+
     def _get_task(self, task_id):
         try:
-            cur = self.db.conn.cursor()
-            cur.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
-            return cur.fetchone()
+            return self.db.get_task(task_id)
         except Exception:
             logger.exception("Failed to fetch task %s", task_id)
             return None
@@ -655,6 +1219,30 @@ class TaskApp(tk.Tk):
         return html.strip()
 
 
+    def _outlook_ns(self):
+        """
+        Return the cached Outlook MAPI namespace, dispatching Outlook.Application
+        only on first use or after the cached object stops responding
+        (e.g. Outlook was restarted). Raises if Outlook can't be reached.
+        """
+        if self._ol_ns is not None:
+            try:
+                self._ol_app.Version
+                return self._ol_ns
+            except Exception:
+                logger.info("Cached Outlook COM object is stale; reconnecting")
+                self._ol_app = None
+                self._ol_ns = None
+        try:
+            # early-bound wrapper avoids a GetIDsOfNames call per attribute access
+            app = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+        except Exception:
+            app = win32com.client.Dispatch("Outlook.Application")
+        ns = app.GetNamespace("MAPI")
+        self._ol_app = app
+        self._ol_ns = ns
+        return ns
+
     def _open_outlook_email(self, task_id):
         task = self.db.get_task(task_id)
         if not task or not task["outlook_id"]:
@@ -662,8 +1250,7 @@ class TaskApp(tk.Tk):
             return
 
         try:
-            outlook = win32com.client.Dispatch("Outlook.Application")
-            ns = outlook.GetNamespace("MAPI")
+            ns = self._outlook_ns()
 
             # 1️⃣ Fast path: EntryID + StoreID
             try:
@@ -712,8 +1299,7 @@ class TaskApp(tk.Tk):
             return
 
         try:
-            outlook = win32com.client.Dispatch("Outlook.Application")
-            ns = outlook.GetNamespace("MAPI")
+            ns = self._outlook_ns()
             mail = ns.GetItemFromID(entry_id, store_id)
 
             try:
@@ -733,28 +1319,33 @@ class TaskApp(tk.Tk):
             return
 
         subject = task["title"].replace("[OM]:", "").strip()
+        # fold the needle once, not per mail
+        needle = subject.casefold()
 
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        ns = outlook.GetNamespace("MAPI")
-        inbox = ns.GetDefaultFolder(6)  # Inbox
-
-        items = inbox.Items
-        items.Sort("[ReceivedTime]", True)
+        def _find_and_show(ol_app, ns):
+            # runs on the Outlook worker: walking the Inbox over COM can take a while
+            inbox = ns.GetDefaultFolder(6)  # Inbox
+            items = inbox.Items
+            items.Sort("[ReceivedTime]", True)
 
-        chain = []
-        for mail in items:
-            try:
-                if subject.lower() in mail.Subject.lower():
-                    chain.append(mail)
-            except Exception:
-                continue
+            # newest first, and only the latest match is shown: stop at the first hit
+            # instead of reading every Subject in the Inbox over COM
+            for mail in items:
+                try:
+                    if needle in (mail.Subject or "").casefold():
+                        mail.Display()
+                        return True
+                except Exception:
+                    continue
+            return False
 
-        if not chain:
-            messagebox.showinfo("Outlook", "No matching email chain found")
-            return
+        def _done(found):
+            if found is None:
+                messagebox.showerror("Outlook", "Could not search Outlook (see logs).")
+            elif not found:
+                messagebox.showinfo("Outlook", "No matching email chain found")
 
-        # show latest email
-        chain[0].Display()
+        self._outlook_submit(_find_and_show, _done)
 
     def _attach_latest_reply(self, task_id):
         task = self._get_task(task_id)
@@ -769,8 +1360,7 @@ class TaskApp(tk.Tk):
             return
 
         try:
-            outlook = win32com.client.Dispatch("Outlook.Application")
-            ns = outlook.GetNamespace("MAPI")
+            ns = self._outlook_ns()
             mail = ns.GetItemFromID(entry_id, store_id)
 
             attachments = []
@@ -798,7 +1388,7 @@ class TaskApp(tk.Tk):
 
     def _find_latest_outlook_mail(self, task_row):
         try:
-            outlook = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
+            outlook = self._outlook_ns()
             inbox = outlook.GetDefaultFolder(6)  # Inbox
             items = inbox.Items
             items.Sort("[ReceivedTime]", True)
@@ -831,16 +1421,19 @@ class TaskApp(tk.Tk):
         if not confirm:
             return
 
+        task_ids = []
         for s in sel:
             try:
-                task_id = int(self.future_tree.item(s, "values")[0])
-                self.db.soft_delete(task_id)
+                task_ids.append(int(self.future_tree.item(s, "values")[0]))
             except Exception:
-                logger.exception("Failed to delete future task")
+                logger.exception("Failed to read future task id")
+        try:
+            self.db.soft_delete_many(task_ids)
+        except Exception:
+            logger.exception("Failed to delete future tasks")
 
         # refresh all views
-        self._populate()
-        self._populate_kanban()
+        self._request_refresh()
         self._populate_future_tasks()
         self._populate_trash()
     def _move_selected_to_future(self):
@@ -850,8 +1443,7 @@ class TaskApp(tk.Tk):
         for s in sel:
             task_id = int(self.tree.item(s, "values")[0])
             self.db.mark_future(task_id)
-        self._populate()
-        self._populate_kanban()
+        self._request_refresh()
         self._populate_future_tasks()
 
 
@@ -862,34 +1454,35 @@ class TaskApp(tk.Tk):
         for s in sel:
             task_id = int(self.future_tree.item(s, "values")[0])
             self.db.pull_from_future(task_id)
-        self._populate()
-        self._populate_kanban()
+        self._request_refresh()
         self._populate_future_tasks()
         
+    def _tab_hidden(self, tab):
+        """
+        True when `tab` is not the selected notebook tab. The tab is then
+        marked stale, so _on_tab_changed repopulates it when it is shown.
+        """
+        try:
+            if self.notebook.select() == str(tab):
+                return False
+        except Exception:
+            return False
+        self._stale_tabs.add(str(tab))
+        return True
+
     def _populate_future_tasks(self):
+        if self._tab_hidden(self.future_tab):
+            return
         try:
             for iid in self.future_tree.get_children():
                 self.future_tree.delete(iid)
         except Exception:
             pass
 
-        rows = self.db.fetch_future_tasks()
-        ft = self.filter_text_var.get().strip().lower()
-        fpri = self.filter_priority_var.get()
-        fstat = self.filter_status_var.get()
-        fdue = self.filter_due_var.get().strip()
-
-        def match(r):
-            if ft and ft not in ((r["title"] or "") + (r["description"] or "")).lower():
-                return False
-            if fpri != "All" and r["priority"] != fpri:
-                return False
-            if fstat != "All" and r["status"] != fstat:
-                return False
-            if fdue and r["due_date"] != fdue:
-                return False
-            return True
-        rows = [r for r in rows if match(r)]
+        filters = self._current_filters()
+        # Future never lists completed tasks, so "Show Completed" doesn't apply
+        filters.pop("show_completed", None)
+        rows = self.db.fetch_future_tasks(**filters)
         for r in rows:
             self.future_tree.insert(
                 "",
@@ -904,15 +1497,34 @@ class TaskApp(tk.Tk):
             )
 
 
+    # Kanban cards created per column up front / per scroll-to-bottom
+    KANBAN_PAGE = 40
+
     def _bind_global_kanban_mousewheel(self):
+        """
+        One app-wide wheel handler for every scrollable Canvas (Kanban columns,
+        editor windows): scroll the nearest Canvas above the pointer's widget.
+        Canvases don't bind the wheel themselves, so nothing piles up per window.
+        """
         def _on_mousewheel(event):
             widget = event.widget
+            if event.num == 4:
+                step = -1
+            elif event.num == 5:
+                step = 1
+            elif event.delta:
+                # Windows reports multiples of 120, macOS raw units
+                step = int(-event.delta / 120) if sys.platform.startswith("win") else -event.delta
+            else:
+                return None
 
             # Walk up widget hierarchy to find a Canvas
-            while widget is not None:
+            while widget is not None and not isinstance(widget, str):
+                if isinstance(widget, (tk.Text, tk.Listbox, ttk.Treeview)):
+                    # scrolls itself via its class binding
+                    return None
                 if isinstance(widget, tk.Canvas):
-                    if event.delta:
-                        widget.yview_scroll(int(-event.delta / 120), "units")
+                    widget.yview_scroll(step, "units")
                     return "break"
                 widget = widget.master
             return None
@@ -942,10 +1554,63 @@ class TaskApp(tk.Tk):
         self.kanban_card_widgets = {}
         # keep reference to currently highlighted widget (so we can un-highlight it)
         self._kanban_highlighted = None
+        # status -> signature of the cards last rendered in that column
+        self._kanban_rendered = {}
+        # status -> {task_id: (card wrapper, card signature)} currently on screen
+        self._kanban_cards = {status: {} for status in STATUSES}
+        # status -> filtered rows for that column, and how many of them have cards;
+        # a column grows by KANBAN_PAGE cards whenever it is scrolled to the bottom
+        self._kanban_data = {status: [] for status in STATUSES}
+        self._kanban_limit = {status: self.KANBAN_PAGE for status in STATUSES}
+        # case-insensitive status text -> canonical STATUSES entry
+        self._status_lookup = {s.lower(): s for s in STATUSES}
+        # set while a _request_refresh() is pending
+        self._ui_dirty = False
+        # pending debounced _apply_filters (see _schedule_apply_filters)
+        self._filter_after_id = None
+        # Trash / Future tabs whose contents went stale while hidden; they are
+        # repopulated when next shown (see _on_tab_changed)
+        self._stale_tabs = set()
+        # Responsible dropdown label -> contact id, shared by all editor windows;
+        # refreshed from TaskDB.get_contact_choices() whenever a dropdown loads
+        self._contacts_label_to_id = {}
+        # Task List sort: heading clicked last (None = default due-date order)
+        # and the direction each heading was last sorted in
+        self._sort_col = None
+        self._sort_state = {}
+        # Outlook COM objects, created on first use (see _outlook_ns)
+        self._ol_app = None
+        self._ol_ns = None
+        # background flagged-mail fetch state
+        self._outlook_fetch_running = False
+        self._outlook_refresh_after_id = None
+        # Outlook worker thread for sends (see _outlook_submit), started on first use
+        self._outlook_worker = None
+        self._outlook_jobs = queue.Queue()
+        self._outlook_results = queue.Queue()
+        self._outlook_pending = 0
+        # task id -> reminder popup still on screen, and withdrawn popups ready for reuse
+        self._reminder_popups = {}
+        self._reminder_popup_pool = []
+        # snooze/dismiss clicks not yet written: task id -> (minutes, ts) / ts.
+        # A burst of clicks is flushed in one transaction (see _flush_reminder_updates)
+        self._pending_snoozes = {}
+        self._pending_dismissals = {}
+        self._reminder_flush_id = None
+        # pending coalesced topmost re-raise for open popups
+        self._reminder_raise_id = None
 
         # attachments var
         self.attachments_var = tk.StringVar(value="")
 
+        # Task List rows currently shown: iid -> (values, tags)
+        self._last_rows = {}
+        # reminder column text last written by the countdown ticker: iid -> text
+        self._last_reminder_text = {}
+        # pending _refresh_reminder_display callback and when it fires
+        self._reminder_tick_id = None
+        self._reminder_tick_due = None
+
         # Build UI
         self._build_ui()
         self._bind_global_kanban_mousewheel()
@@ -956,6 +1621,8 @@ class TaskApp(tk.Tk):
         try:
             # cheap test handler: will always log when any double-click happens anywhere
             def _dbg_any_double(e):
+                if not logger.isEnabledFor(logging.DEBUG):
+                    return
                 logger.debug("GLOBAL DEBUG DOUBLE CLICK event: widget=%s x_root=%s y_root=%s type=%s",
                             getattr(e, "widget", None), getattr(e, "x_root", None), getattr(e, "y_root", None), getattr(e, "type", None))
 
@@ -977,7 +1644,6 @@ class TaskApp(tk.Tk):
             self.tree.bind("<Delete>", lambda e: self._delete_task())
             #self.tree.bind("<BackSpace>", lambda e: self._delete_task())
 
-            self.trash_tree.bind("<Delete>", lambda e: self._permanently_delete_selected_trash())
             #self.trash_tree.bind("<BackSpace>", lambda e: self._permanently_delete_selected_trash())
 
             for status, lb in self.kanban_lists.items():
@@ -995,8 +1661,7 @@ class TaskApp(tk.Tk):
         # initial populate
         self.after(100, self._populate)
         self.after(100, self._populate_kanban)
-        self.after(200, self._populate_trash)
-        self.after(200, self._populate_future_tasks)
+        # Trash and Future fill in when first shown
 
         # reminders
         self._schedule_task_reminder_checker()
@@ -1057,74 +1722,77 @@ class TaskApp(tk.Tk):
     # -------------------- Reminder UI & Backend --------------------
     def _format_timedelta(self, td):
         total_seconds = int(td.total_seconds())
-        if total_seconds <= 0:
-            return "Now"
-        hours, rem = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(rem, 60)
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        if minutes >= 1:
-            return f"{minutes}m {seconds}s"
-        return f"{seconds}s"
+        if total_seconds >= 3600:
+            total_seconds -= total_seconds % 60
+        return _format_remaining(total_seconds)
+
+    def _schedule_reminder_display(self, delay_ms=0):
+        """
+        Run the countdown refresh in `delay_ms`, unless it is already due sooner.
+        Called by the refresh itself and whenever reminder data or rows change.
+        """
+        due = datetime.now() + timedelta(milliseconds=delay_ms)
+        if self._reminder_tick_id is not None:
+            if self._reminder_tick_due <= due:
+                return
+            try:
+                self.after_cancel(self._reminder_tick_id)
+            except Exception:
+                pass
+        self._reminder_tick_due = due
+        self._reminder_tick_id = self.after(delay_ms, self._refresh_reminder_display)
 
     def _refresh_reminder_display(self):
+        self._reminder_tick_id = None
+        # sleep until the next countdown text would change; the one-minute cap is
+        # a safety net for reminder edits that bypass _schedule_reminder_display
+        delay = 60000
         try:
-            cur = self.db.conn.cursor()
-            for iid in self.tree.get_children():
-                vals = self.tree.item(iid, "values")
-                if not vals:
-                    continue
+            # one query and one clock read per refresh, instead of a SELECT per visible row
+            reminders = {r[0]: r for r in self.db.fetch_reminders()}
+            now = datetime.now()
+            for iid in self._last_rows:
                 try:
-                    task_id = int(vals[0])
+                    row = reminders.get(int(iid))
                 except Exception:
                     continue
 
-                cur.execute("SELECT reminder_minutes, reminder_set_at, reminder_sent_at FROM tasks WHERE id=?", (task_id,))
-                row = cur.fetchone()
                 display = "—"
                 if row:
-                    rm = row["reminder_minutes"]
-                    set_at = row["reminder_set_at"]
-                    sent_at = row["reminder_sent_at"]
-                    if rm is None or rm == "" or set_at is None:
-                        display = "—"
-                    else:
-                        try:
-                            rm_int = int(rm)
-                        except Exception:
-                            display = "—"
-                            self.tree.set(iid, "reminder", display)
-                            continue
-                        try:
-                            set_dt = datetime.fromisoformat(set_at)
-                        except Exception:
-                            display = "—"
-                            self.tree.set(iid, "reminder", display)
-                            continue
-
-                        target = set_dt + timedelta(minutes=rm_int)
+                    _, minutes, set_at, sent_at = row
+                    try:
+                        target = datetime.fromisoformat(set_at) + timedelta(minutes=int(minutes))
+                    except Exception:
+                        target = None
+                    if target is not None:
+                        sent_dt = None
                         if sent_at:
                             try:
                                 sent_dt = datetime.fromisoformat(sent_at)
-                                if sent_dt >= target:
-                                    display = "Sent"
-                                else:
-                                    remaining = target - datetime.now()
-                                    display = self._format_timedelta(remaining)
                             except Exception:
-                                remaining = target - datetime.now()
-                                display = self._format_timedelta(remaining)
+                                sent_dt = None
+                        if sent_dt is not None and sent_dt >= target:
+                            display = "Sent"
                         else:
-                            remaining = target - datetime.now()
+                            remaining = target - now
                             display = self._format_timedelta(remaining)
-                try:
-                    self.tree.set(iid, "reminder", display)
-                except Exception:
-                    pass
+                            secs = remaining.total_seconds()
+                            if secs > 0:
+                                # under an hour the text changes every second, above it
+                                # at the next minute boundary
+                                step = 1 if secs < 3600 else (secs % 60) or 60
+                                delay = min(delay, int(step * 1000) + 50)
+                # only touch the Treeview when the text actually changes
+                if self._last_reminder_text.get(iid) != display:
+                    try:
+                        self.tree.set(iid, "reminder", display)
+                        self._last_reminder_text[iid] = display
+                    except Exception:
+                        pass
         except Exception:
             pass
         finally:
-            self.after(1000, self._refresh_reminder_display)
+            self._schedule_reminder_display(delay)
 
     def _schedule_task_reminder_checker(self):
         try:
@@ -1145,47 +1813,23 @@ class TaskApp(tk.Tk):
         Manual sending can be done via 'Send Reminder Now (Outlook)' button in the edit window.
         """
         try:
-            cur = self.db.conn.cursor()
-            cur.execute("""
-                SELECT id, title, description, reminder_minutes, reminder_set_at, reminder_sent_at, responsible_id, reminder_email_body
-                FROM tasks
-                WHERE reminder_minutes IS NOT NULL AND reminder_minutes != '' AND reminder_set_at IS NOT NULL
-                AND status != 'Done'
-            """)
-            rows = cur.fetchall()
-            now_dt = datetime.now()
-            for r in rows:
-                try:
-                    rm_min = int(r["reminder_minutes"])
-                except Exception:
-                    # malformed minutes; skip
+            # closing a popup unregisters it; this only catches windows destroyed outright
+            self._reminder_popups = {tid: w for tid, w in self._reminder_popups.items() if w.winfo_exists()}
+            for task_id, title, description in self.db.fetch_due_reminders():
+                # a reminder stays due until dismissed or snoozed; don't stack a new
+                # popup (and toast) for it on every tick
+                if task_id in self._reminder_popups:
                     continue
+                # snoozed/dismissed a moment ago, write not flushed yet
+                if task_id in self._pending_snoozes or task_id in self._pending_dismissals:
+                    continue
+                # show popup only — do NOT automatically send email
                 try:
-                    set_at = datetime.fromisoformat(r["reminder_set_at"]) if r["reminder_set_at"] else None
+                    self._show_reminder_popup(task_id, title, description)
                 except Exception:
-                    continue
-
-                if not set_at:
-                    continue
-
-                target = set_at + timedelta(minutes=rm_min)
-
-                # If target reached and not already sent/shown, show popup.
-                sent = None
-                if r["reminder_sent_at"]:
-                    try:
-                        sent = datetime.fromisoformat(r["reminder_sent_at"])
-                    except Exception:
-                        sent = None
-
-                if now_dt >= target and (sent is None or sent < target):
-                    # show popup only — do NOT automatically send email
-                    try:
-                        self._show_reminder_popup(r["id"], r["title"], r["description"])
-                    except Exception:
-                        logger.exception("Error showing reminder popup")
-                    # IMPORTANT: do NOT update reminder_sent_at here. Leaving reminder_sent_at unset
-                    # allows the user to still manually send the reminder via the editor.
+                    logger.exception("Error showing reminder popup")
+                # IMPORTANT: do NOT update reminder_sent_at here. Leaving reminder_sent_at unset
+                # allows the user to still manually send the reminder via the editor.
         except Exception:
             logger.exception("Reminder check error")
 
@@ -1193,52 +1837,64 @@ class TaskApp(tk.Tk):
         if HAS_NOTIFY:
             _safe_show_toast(f"Reminder: {title}", description or "Task due soon")
 
-        win = tk.Toplevel(self)
-        win.title("🔔 Task Reminder")
-        win.geometry("640x320")
+        # closed popups are withdrawn and kept for reuse; building one is the slow part
+        win = self._reminder_popup_pool.pop() if self._reminder_popup_pool else self._build_reminder_popup()
+        win.task_id = task_id
+        self._reminder_popups[task_id] = win
+        win.header.config(text=title)
+        win.txt.config(state="normal")
+        win.txt.delete("1.0", tk.END)
+        win.txt.insert("1.0", description or "(no description)")
+        win.txt.config(state="disabled")
         try:
             if str(self.state()) == "iconic":
                 self.deiconify()
         except Exception:
             pass
         try:
+            # topmost is enough to surface it; no global input grab
+            win.deiconify()
             win.attributes("-topmost", True)
             win.lift()
-            win.update_idletasks()
-            try:
-                win.grab_set_global()
-            except Exception:
-                try:
-                    win.grab_set()
-                except Exception:
-                    pass
+            win.focus_force()
+        except Exception:
+            pass
+        # re-assert topmost once other windows have settled; one pending raise
+        # covers every popup that opens in the meantime
+        if self._reminder_raise_id is None:
+            self._reminder_raise_id = self.after(1500, self._raise_reminder_popups)
+
+    def _raise_reminder_popups(self):
+        """Re-assert topmost on every reminder popup still on screen."""
+        self._reminder_raise_id = None
+        for win in list(self._reminder_popups.values()):
             try:
-                self.lift()
+                win.attributes("-topmost", True)
             except Exception:
                 pass
-        except Exception:
-            pass
 
-        header = ttk.Label(win, text=title, font=("", 14, "bold"))
-        header.pack(padx=12, pady=(12, 6), anchor="w")
+    def _build_reminder_popup(self):
+        """Create a hidden reminder popup; its buttons act on whatever task it currently shows."""
+        win = tk.Toplevel(self)
+        win.withdraw()
+        win.task_id = None
+        win.title("🔔 Task Reminder")
+        win.geometry("640x320")
+        win.protocol("WM_DELETE_WINDOW", lambda: self._close_reminder_popup(win))
+
+        win.header = ttk.Label(win, text="", font=("", 14, "bold"))
+        win.header.pack(padx=12, pady=(12, 6), anchor="w")
 
-        txt = tk.Text(win, height=8, wrap="word", padx=8, pady=4)
-        txt.insert("1.0", description or "(no description)")
-        txt.config(state="disabled")
-        txt.pack(fill=tk.BOTH, expand=False, padx=12, pady=(0, 8))
+        win.txt = tk.Text(win, height=8, wrap="word", padx=8, pady=4)
+        win.txt.config(state="disabled")
+        win.txt.pack(fill=tk.BOTH, expand=False, padx=12, pady=(0, 8))
 
         btnf = ttk.Frame(win)
         btnf.pack(fill=tk.X, padx=12, pady=8)
 
         def open_task():
-            try:
-                win.grab_release()
-            except Exception:
-                pass
-            try:
-                win.destroy()
-            except Exception:
-                pass
+            task_id = win.task_id
+            self._close_reminder_popup(win)
             try:
                 self._open_edit_window(task_id)
             except Exception:
@@ -1251,59 +1907,57 @@ class TaskApp(tk.Tk):
                 messagebox.showerror("Snooze Error", "Invalid snooze minutes value.")
                 return
 
-            new_set = datetime.now().isoformat(timespec="seconds")
-            try:
-                with self.db.conn:
-                    self.db.conn.execute(
-                        "UPDATE tasks SET reminder_minutes=?, reminder_set_at=?, reminder_sent_at=? WHERE id=?",
-                        (minutes_int, new_set, None, task_id)
-                    )
-            except Exception:
-                logger.exception("Snooze update error")
-                try:
-                    messagebox.showerror("Snooze Error", "Could not snooze reminder.", parent=win)
-                except Exception:
-                    pass
-                return
-            try:
-                win.grab_release()
-            except Exception:
-                pass
-            try:
-                win.destroy()
-            except Exception:
-                pass
+            # the latest click for a task wins
+            self._pending_dismissals.pop(win.task_id, None)
+            self._pending_snoozes[win.task_id] = (minutes_int, _now_iso())
+            self._schedule_reminder_flush()
+            self._close_reminder_popup(win)
 
         def dismiss():
-            now_iso = datetime.now().isoformat(timespec="seconds")
-            try:
-                with self.db.conn:
-                    self.db.conn.execute("UPDATE tasks SET reminder_sent_at=? WHERE id=?", (now_iso, task_id))
-            except Exception:
-                logger.exception("Dismiss update error")
-                try:
-                    messagebox.showerror("Dismiss Error", "Could not dismiss reminder.", parent=win)
-                except Exception:
-                    pass
-            try:
-                win.grab_release()
-            except Exception:
-                pass
-            try:
-                win.destroy()
-            except Exception:
-                pass
+            self._pending_snoozes.pop(win.task_id, None)
+            self._pending_dismissals[win.task_id] = _now_iso()
+            self._schedule_reminder_flush()
+            self._close_reminder_popup(win)
 
         ttk.Button(btnf, text="Open Task", command=open_task).pack(side=tk.LEFT, padx=6)
         ttk.Button(btnf, text="Snooze 5m", command=lambda: _snooze(5)).pack(side=tk.LEFT, padx=6)
         ttk.Button(btnf, text="Snooze 10m", command=lambda: _snooze(10)).pack(side=tk.LEFT, padx=6)
         ttk.Button(btnf, text="Snooze 30m", command=lambda: _snooze(30)).pack(side=tk.LEFT, padx=6)
         ttk.Button(btnf, text="Dismiss", command=dismiss).pack(side=tk.RIGHT, padx=6)
-
+        return win
+
+    def _schedule_reminder_flush(self, delay_ms=500):
+        if self._reminder_flush_id is None:
+            self._reminder_flush_id = self.after(delay_ms, self._flush_reminder_updates)
+
+    def _flush_reminder_updates(self):
+        """Write queued snoozes and dismissals, one transaction per kind."""
+        self._reminder_flush_id = None
+        snoozes, self._pending_snoozes = self._pending_snoozes, {}
+        dismissals, self._pending_dismissals = self._pending_dismissals, {}
+        for write, pending, title, message in (
+            (self.db.snooze_reminders, snoozes, "Snooze Error", "Could not snooze reminder."),
+            (self.db.dismiss_reminders, dismissals, "Dismiss Error", "Could not dismiss reminder."),
+        ):
+            try:
+                write(pending)
+            except Exception:
+                logger.exception("Reminder update error (%s)", title)
+                try:
+                    messagebox.showerror(title, message)
+                except Exception:
+                    pass
+        if snoozes or dismissals:
+            self._schedule_reminder_display(0)
+
+    def _close_reminder_popup(self, win):
+        """Hide a reminder popup and return it to the pool for the next reminder."""
+        if self._reminder_popups.get(win.task_id) is win:
+            del self._reminder_popups[win.task_id]
+        win.task_id = None
         try:
-            win.focus_force()
-            win.update()
-            self.after(1500, lambda: win.attributes("-topmost", True))
+            win.withdraw()
+            self._reminder_popup_pool.append(win)
         except Exception:
             pass
 
@@ -1326,12 +1980,11 @@ class TaskApp(tk.Tk):
             self.filter_due_var = tk.StringVar(value="")
 
         filter_frame = ttk.Frame(parent, padding=(6, 4))
-        filter_frame.pack(fill=tk.X, padx=6, pady=(6, 4))
 
         ttk.Label(filter_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 4))
         search_entry = ttk.Entry(filter_frame, textvariable=self.filter_text_var, width=30)
         search_entry.pack(side=tk.LEFT)
-        search_entry.bind("<KeyRelease>", lambda e: self._apply_filters())
+        search_entry.bind("<KeyRelease>", lambda e: self._schedule_apply_filters())
 
         ttk.Label(filter_frame, text="Priority:").pack(side=tk.LEFT, padx=(12, 4))
         pri_vals = ["All"] + PRIORITIES
@@ -1354,6 +2007,9 @@ class TaskApp(tk.Tk):
         ttk.Label(filter_frame, text="Due on (YYYY-MM-DD):").pack(side=tk.LEFT, padx=(12, 4))
         due_entry = ttk.Entry(filter_frame, textvariable=self.filter_due_var, width=12)
         due_entry.pack(side=tk.LEFT)
+        # a partial date is invalid, so apply on commit rather than per keystroke
+        due_entry.bind("<Return>", lambda e: self._apply_filters())
+        due_entry.bind("<FocusOut>", lambda e: self._schedule_apply_filters())
 
         ttk.Button(filter_frame, text="Apply", command=self._apply_filters).pack(side=tk.LEFT, padx=(12, 4))
         ttk.Button(filter_frame, text="Clear", command=self._clear_filters).pack(side=tk.LEFT)
@@ -1387,22 +2043,17 @@ class TaskApp(tk.Tk):
         list_tab = ttk.Frame(self.notebook)
         self.notebook.add(list_tab, text="Task List")
 
-        # include 'reminder' column always and 'responsible'
-                # include 'reminder' column always and 'responsible'
-        # Make Task ID visible in the task list
-        if self.settings.get("show_description", False):
-            cols = ["id", "title", "desc", "due", "priority", "status", "responsible", "reminder"]
-            # include id in display cols so it's visible
-            display_cols = ["id", "title", "desc", "due", "priority", "status", "responsible", "reminder"]
-        else:
-            cols = ["id", "title", "due", "priority", "status", "responsible", "reminder"]
-            display_cols = ["id", "title", "due", "priority", "status", "responsible", "reminder"]
+        # 'reminder' and 'responsible' are always shown, and so is the Task ID
+        col_specs = COLUMN_SPECS_FULL if self.settings.get("show_description", False) else COLUMN_SPECS_COMPACT
+        cols = list(col_specs)
 
         # Filter bar
         #filter_frame = ttk.Frame(list_tab, padding=(6, 4))
 
-        # Reusable filter bar (Task List)
-        self._create_filter_bar(list_tab)
+        # One filter bar, owned by the root window and packed into whichever
+        # filtered tab is showing (see _place_filter_bar)
+        self._filter_bar = self._create_filter_bar(self)
+        self._filter_tabs = {str(list_tab)}
         """/* filter_frame.pack(fill=tk.X, padx=6, pady=(6, 4))
 
         ttk.Label(filter_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 4))
@@ -1441,7 +2092,7 @@ class TaskApp(tk.Tk):
         ttk.Button(filter_frame, text="Clear", command=self._clear_filters).pack(side=tk.LEFT)
         """
         # Treeview
-        self.tree = ttk.Treeview(list_tab, columns=cols, show="headings", displaycolumns=display_cols)
+        self.tree = ttk.Treeview(list_tab, columns=cols, show="headings", displaycolumns=cols)
         self.tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
         self.task_tree = self.tree
         self.active_task_tree = self.tree  # default active tree
@@ -1450,37 +2101,12 @@ class TaskApp(tk.Tk):
             lambda e, t=self.tree: setattr(self, "active_task_tree", t)
         )
 
-        for col in cols:
+        for col, (width, anchor) in col_specs.items():
             header_text = col.title() if col != "id" else "ID"
-            self.tree.heading(col, text=header_text, command=lambda _col=col: self._treeview_sort_column(_col, False))
-
-        # Column widths
-        if self.settings.get("show_description", False):
-            self.tree.column("id", width=60, anchor="center")
-            self.tree.column("title", width=300, anchor="w")
-            self.tree.column("desc", width=300, anchor="w")
-            self.tree.column("due", width=100, anchor="center")
-            self.tree.column("priority", width=90, anchor="center")
-            self.tree.column("status", width=90, anchor="center")
-            self.tree.column("responsible", width=180, anchor="w")
-            self.tree.column("reminder", width=120, anchor="center")
-        else:
-            self.tree.column("id", width=60, anchor="center")
-            self.tree.column("title", width=420, anchor="w")
-            self.tree.column("due", width=120, anchor="center")
-            self.tree.column("priority", width=100, anchor="center")
-            self.tree.column("status", width=100, anchor="center")
-            self.tree.column("responsible", width=180, anchor="w")
-            self.tree.column("reminder", width=120, anchor="center")
+            self.tree.heading(col, text=header_text, command=lambda _col=col: self._sql_sort(_col))
+            self.tree.column(col, width=width, anchor=anchor)
 
-        try:
-            self.tree.tag_configure("priority_high", background="#FFD6D6")
-            self.tree.tag_configure("priority_medium", background="#FFF5CC")
-            self.tree.tag_configure("priority_low", background="#E6FFEA")
-            self.tree.tag_configure("oddrow", background="#FFFFFF")
-            self.tree.tag_configure("evenrow", background="#F6F6F6")
-        except Exception:
-            pass
+        self._init_tree_tags()
 
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
         self.tree.bind("<Double-1>", self._on_task_double_click)
@@ -1504,8 +2130,7 @@ class TaskApp(tk.Tk):
 
         # Kanban tab
         self.kanban_tab = ttk.Frame(self.notebook, padding=10)
-                # Add the shared filter bar to Kanban
-        self._create_filter_bar(self.kanban_tab)
+        self._filter_tabs.add(str(self.kanban_tab))
         self.notebook.add(self.kanban_tab, text="Kanban Board")
 
         frame = ttk.Frame(self.kanban_tab)
@@ -1523,24 +2148,13 @@ class TaskApp(tk.Tk):
             # Canvas to hold cards + inner frame
             canvas_col = tk.Canvas(col, highlightthickness=0)
             vscroll = ttk.Scrollbar(col, orient=tk.VERTICAL, command=canvas_col.yview)
-            canvas_col.configure(yscrollcommand=vscroll.set)
+            canvas_col.configure(
+                yscrollcommand=lambda lo, hi, _s=status, _sb=vscroll: self._on_kanban_yscroll(_s, _sb, lo, hi)
+            )
             vscroll.pack(side=tk.RIGHT, fill=tk.Y)
             canvas_col.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-            # ---- Mouse wheel support for Kanban canvas (Windows / macOS / Linux) ----
-            def _bind_kanban_mousewheel(canvas):
-                def _on_mousewheel(event):
-                    if event.delta:
-                        canvas.yview_scroll(int(-event.delta / 120), "units")
-
-                # Windows & macOS
-                canvas.bind("<MouseWheel>", _on_mousewheel)
-
-                # Linux
-                canvas.bind("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
-                canvas.bind("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
-
-            _bind_kanban_mousewheel(canvas_col)
+            # mouse wheel: handled app-wide by _bind_global_kanban_mousewheel
 
             inner = ttk.Frame(canvas_col)
             window_id = canvas_col.create_window((0, 0), window=inner, anchor="nw")
@@ -1551,76 +2165,35 @@ class TaskApp(tk.Tk):
 
             canvas_col.bind("<Configure>", _resize_inner)
 
-            def _configure_inner(e, c=canvas_col):
-                c.configure(scrollregion=c.bbox("all"))
-            inner.bind("<Configure>", _configure_inner)
-
-            # store references
-            self.kanban_columns[status] = {"canvas": canvas_col, "frame": inner, "scroll": vscroll, "status_name": status}
-
-            # clicking on the canvas/frame will select card via bind (cards will be clickable)
-
-        # Kanban details panel
-        desc_frame = ttk.Frame(frame, padding=6, borderwidth=1, relief="groove")
-        desc_frame.grid(row=0, column=len(STATUSES), sticky="nsew", padx=6)
-        frame.columnconfigure(len(STATUSES), weight=1)
-
-        if HAS_HTML:
-            self.kanban_html = HTMLLabel(desc_frame, html="", width=50, height=15)
-            self.kanban_text = tk.Text(desc_frame, wrap="word", height=15, width=50)
-        else:
-            self.kanban_html = tk.Text(desc_frame, wrap="word", height=15, width=50)
-            self.kanban_text = self.kanban_html
-
-        ttk.Label(desc_frame, text="Task Description / Email").pack(anchor="w")
-        self.kanban_text.pack(fill=tk.BOTH, expand=True)
+            def _configure_inner(e, c=canvas_col):
+                c.configure(scrollregion=c.bbox("all"))
+            inner.bind("<Configure>", _configure_inner)
 
-        self.btn_save_desc = ttk.Button(desc_frame, text="Save Description", command=self._save_kanban_desc)
-        self.btn_save_desc.pack(pady=5)
+            # store references
+            self.kanban_columns[status] = {"canvas": canvas_col, "frame": inner, "scroll": vscroll, "status_name": status}
 
-        ttk.Label(desc_frame, text="Progress Log").pack(anchor="w")
-        self.kanban_progress = tk.Text(desc_frame, height=8, wrap="word", width=50)
-        self.kanban_progress.pack(fill=tk.BOTH, expand=True)
-        ttk.Button(desc_frame, text="Update Progress", command=self._update_progress).pack(pady=5)
+            # clicking on the canvas/frame will select card via bind (cards will be clickable)
 
-        ttk.Label(desc_frame, text="Attachments").pack(anchor="w", pady=(10, 0))
+        # Kanban details panel (contents are built on first visit to the Kanban tab)
+        self._kanban_desc_frame = ttk.Frame(frame, padding=6, borderwidth=1, relief="groove")
+        self._kanban_desc_frame.grid(row=0, column=len(STATUSES), sticky="nsew", padx=6)
+        frame.columnconfigure(len(STATUSES), weight=1)
+        self.kanban_html = None
+        self.kanban_text = None
+        self.kanban_progress = None
         self.kanban_attachments_var = tk.StringVar()
-        self.kanban_attachments_label = ttk.Label(desc_frame, textvariable=self.kanban_attachments_var, wraplength=350)
-        self.kanban_attachments_label.pack(anchor="w", fill=tk.X, pady=2)
-        ttk.Button(desc_frame, text="Open Attachments", command=self._open_selected_kanban_attachments).pack(anchor="w", pady=2)
-
-        # Trash tab
-        trash_tab = ttk.Frame(self.notebook)
-                # Add the shared filter bar to Trash
-        self._create_filter_bar(trash_tab)
-        self.notebook.add(trash_tab, text="Trash")
 
-        trash_toolbar = ttk.Frame(trash_tab, padding=6)
-        trash_toolbar.pack(fill=tk.X)
-        ttk.Button(trash_toolbar, text="Restore", command=self._restore_selected_trash).pack(side=tk.LEFT, padx=4)
-        ttk.Button(trash_toolbar, text="Delete Permanently", command=self._permanently_delete_selected_trash).pack(side=tk.LEFT, padx=4)
-        ttk.Button(trash_toolbar, text="Empty Trash", command=self._empty_trash_confirm).pack(side=tk.LEFT, padx=4)
-        ttk.Button(trash_toolbar, text="Refresh", command=self._populate_trash).pack(side=tk.RIGHT, padx=4)
+        # Trash tab (contents are built on first visit)
+        self.trash_tab = ttk.Frame(self.notebook)
+        self._filter_tabs.add(str(self.trash_tab))
+        self.notebook.add(self.trash_tab, text="Trash")
+        self.trash_tree = None
 
-        self.trash_tree = ttk.Treeview(trash_tab, columns=["id", "title", "deleted_at", "due", "priority", "status"], show="headings")
-        self.trash_tree.heading("id", text="ID")
-        self.trash_tree.heading("title", text="Title")
-        self.trash_tree.heading("deleted_at", text="Deleted At")
-        self.trash_tree.heading("due", text="Due")
-        self.trash_tree.heading("priority", text="Priority")
-        self.trash_tree.heading("status", text="Status")
-        self.trash_tree.column("id", width=60, anchor="center")
-        self.trash_tree.column("title", width=400, anchor="w")
-        self.trash_tree.column("deleted_at", width=160, anchor="center")
-        self.trash_tree.column("due", width=120, anchor="center")
-        self.trash_tree.column("priority", width=90, anchor="center")
-        self.trash_tree.column("status", width=90, anchor="center")
-        self.trash_tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
-        self.trash_tree.bind("<Double-1>", lambda e: self._restore_selected_trash())
 
         # add future
-        future_tab = ttk.Frame(self.notebook)
-        self._create_filter_bar(future_tab)
+        future_tab = self.future_tab = ttk.Frame(self.notebook)
+        self._stale_tabs.add(str(future_tab))
+        self._filter_tabs.add(str(future_tab))
         self.notebook.add(future_tab, text="Future Tasks")
 
         future_toolbar = ttk.Frame(future_tab, padding=6)
@@ -1684,6 +2257,107 @@ class TaskApp(tk.Tk):
         )
         self.btn_next.pack(side=tk.LEFT, padx=5)
 
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+        self._place_filter_bar()
+
+    def _on_tab_changed(self, event=None):
+        """
+        Build rarely used tab contents the first time their tab is shown.
+        """
+        try:
+            current = self.notebook.select()
+        except Exception:
+            return
+        try:
+            if current == str(self.trash_tab) and self.trash_tree is None:
+                self._build_trash_ui()
+                self._populate_trash()
+            elif current == str(self.kanban_tab) and self.kanban_progress is None:
+                self._build_kanban_details_ui()
+            if current in self._stale_tabs:
+                self._stale_tabs.discard(current)
+                if current == str(self.trash_tab):
+                    self._populate_trash()
+                elif current == str(self.future_tab):
+                    self._populate_future_tasks()
+        except Exception:
+            logger.exception("Failed to build tab contents")
+        self._place_filter_bar()
+
+    def _place_filter_bar(self):
+        """
+        Pack the shared filter bar at the top of the selected tab, or hide it on
+        tabs without filters. Tk lets a widget be packed into any descendant of
+        its parent, so the one bar serves every tab.
+        """
+        bar = getattr(self, "_filter_bar", None)
+        if bar is None:
+            return
+        try:
+            current = self.notebook.select()
+            bar.pack_forget()
+            if current not in self._filter_tabs:
+                return
+            tab = self.notebook.nametowidget(current)
+            slaves = tab.pack_slaves()
+            if slaves:
+                bar.pack(in_=tab, fill=tk.X, padx=6, pady=(6, 4), before=slaves[0])
+            else:
+                bar.pack(in_=tab, fill=tk.X, padx=6, pady=(6, 4))
+            # keep it stacked above the notebook, which is its sibling
+            bar.lift()
+        except Exception:
+            logger.exception("Could not place filter bar")
+
+    def _build_kanban_details_ui(self):
+        if HAS_HTML:
+            self.kanban_html = HTMLLabel(self._kanban_desc_frame, html="", width=50, height=15)
+            self.kanban_text = tk.Text(self._kanban_desc_frame, wrap="word", height=15, width=50)
+        else:
+            self.kanban_html = tk.Text(self._kanban_desc_frame, wrap="word", height=15, width=50)
+            self.kanban_text = self.kanban_html
+
+        ttk.Label(self._kanban_desc_frame, text="Task Description / Email").pack(anchor="w")
+        self.kanban_text.pack(fill=tk.BOTH, expand=True)
+
+        self.btn_save_desc = ttk.Button(self._kanban_desc_frame, text="Save Description", command=self._save_kanban_desc)
+        self.btn_save_desc.pack(pady=5)
+
+        ttk.Label(self._kanban_desc_frame, text="Progress Log").pack(anchor="w")
+        self.kanban_progress = tk.Text(self._kanban_desc_frame, height=8, wrap="word", width=50)
+        self.kanban_progress.pack(fill=tk.BOTH, expand=True)
+        ttk.Button(self._kanban_desc_frame, text="Update Progress", command=self._update_progress).pack(pady=5)
+
+        ttk.Label(self._kanban_desc_frame, text="Attachments").pack(anchor="w", pady=(10, 0))
+        self.kanban_attachments_label = ttk.Label(self._kanban_desc_frame, textvariable=self.kanban_attachments_var, wraplength=350)
+        self.kanban_attachments_label.pack(anchor="w", fill=tk.X, pady=2)
+        ttk.Button(self._kanban_desc_frame, text="Open Attachments", command=self._open_selected_kanban_attachments).pack(anchor="w", pady=2)
+
+    def _build_trash_ui(self):
+        trash_toolbar = ttk.Frame(self.trash_tab, padding=6)
+        trash_toolbar.pack(fill=tk.X)
+        ttk.Button(trash_toolbar, text="Restore", command=self._restore_selected_trash).pack(side=tk.LEFT, padx=4)
+        ttk.Button(trash_toolbar, text="Delete Permanently", command=self._permanently_delete_selected_trash).pack(side=tk.LEFT, padx=4)
+        ttk.Button(trash_toolbar, text="Empty Trash", command=self._empty_trash_confirm).pack(side=tk.LEFT, padx=4)
+        ttk.Button(trash_toolbar, text="Refresh", command=self._populate_trash).pack(side=tk.RIGHT, padx=4)
+
+        self.trash_tree = ttk.Treeview(self.trash_tab, columns=["id", "title", "deleted_at", "due", "priority", "status"], show="headings")
+        self.trash_tree.heading("id", text="ID")
+        self.trash_tree.heading("title", text="Title")
+        self.trash_tree.heading("deleted_at", text="Deleted At")
+        self.trash_tree.heading("due", text="Due")
+        self.trash_tree.heading("priority", text="Priority")
+        self.trash_tree.heading("status", text="Status")
+        self.trash_tree.column("id", width=60, anchor="center")
+        self.trash_tree.column("title", width=400, anchor="w")
+        self.trash_tree.column("deleted_at", width=160, anchor="center")
+        self.trash_tree.column("due", width=120, anchor="center")
+        self.trash_tree.column("priority", width=90, anchor="center")
+        self.trash_tree.column("status", width=90, anchor="center")
+        self.trash_tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+        self.trash_tree.bind("<Double-1>", lambda e: self._restore_selected_trash())
+        self.trash_tree.bind("<Delete>", lambda e: self._permanently_delete_selected_trash())
+
     ####
     def _send_teams_disabled(self, task_id, recipient_label, subject, body):
         """
@@ -1701,9 +2375,9 @@ class TaskApp(tk.Tk):
                         to_address = m.group(1)
                 else:
                     # try lookup in contacts
-                    for c in (self.db.get_contacts() or []):
-                        if c["name"] == recipient_label or c["email"] == recipient_label:
-                            to_address = c["email"]
+                    for name, email in self.db.get_contact_map().values():
+                        if name == recipient_label or email == recipient_label:
+                            to_address = email
                             break
 
             display_recipient = to_address or (recipient_label or "(no recipient)")
@@ -1729,12 +2403,8 @@ class TaskApp(tk.Tk):
         and a 'Send Reminder Now (Outlook)' button is present.
         This version avoids calling any Teams sending function.
         """
-        try:
-            from tkcalendar import DateEntry  # type: ignore
-            has_dateentry = True
-        except Exception:
-            DateEntry = None
-            has_dateentry = False
+        # tkcalendar is probed once at import time (module-level DateEntry)
+        has_dateentry = HAS_DATEENTRY
 
         win = tk.Toplevel(self)
         win.transient(self)
@@ -1780,16 +2450,7 @@ class TaskApp(tk.Tk):
             canvas.configure(scrollregion=canvas.bbox("all"))
         content_frame.bind("<Configure>", _on_frame_configure)
 
-        def _on_mousewheel(event):
-            if sys.platform.startswith("win") or sys.platform.startswith("linux"):
-                delta = -1 * int(event.delta / 120)
-            else:
-                delta = -1 * int(event.delta)
-            canvas.yview_scroll(delta, "units")
-
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        canvas.bind("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
-        canvas.bind("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
+        # mouse wheel: handled app-wide by _bind_global_kanban_mousewheel
 
         # columns
         for c in range(6):
@@ -1808,6 +2469,7 @@ class TaskApp(tk.Tk):
         staged_attachments = []
         existing_attachments = []
         staged_progress_entries = ""
+        pending_copies = 0
 
         #Moved here
         # Send Reminder Now button (next to email field)
@@ -1842,7 +2504,7 @@ class TaskApp(tk.Tk):
         reminder_cb.set("")
 
         ttk.Label(content_frame, text="Recurrence").grid(row=row, column=2, sticky="w", padx=(12, 0))
-        rec_types = ["None", "Every N days", "Every N weeks", "Every N months"]
+        rec_types = ["None"] + list(RECURRENCE_LABELS.values())
         rec_cb = ttk.Combobox(content_frame, textvariable=rec_type_var, values=rec_types, state="readonly", width=18)
         rec_cb.grid(row=row, column=3, sticky="w", padx=6, pady=4)
         ttk.Label(content_frame, text="N").grid(row=row, column=4, sticky="w")
@@ -1862,21 +2524,10 @@ class TaskApp(tk.Tk):
         # Helper: load contacts to combobox (callable so we can refresh after import)
         def _load_contacts_to_combobox():
             try:
-                contacts = self.db.get_contacts()
-                choices = []
-                lookup_map = {}
-                for c in contacts:
-                    cid = c["id"]
-                    name = c["name"] or ""
-                    email = c["email"] or ""
-                    label = f"{name} <{email}>" if name else email
-                    choices.append(label)
-                    lookup_map[label] = cid
+                choices, self._contacts_label_to_id = self.db.get_contact_choices()
                 responsible_cb['values'] = choices
-                responsible_cb.lookup_map = lookup_map
             except Exception:
                 responsible_cb['values'] = []
-                responsible_cb.lookup_map = {}
 
         # Insert HTML building blocks into the email body text widget
         def _insert_html_at_cursor(html_snippet):
@@ -1963,27 +2614,19 @@ class TaskApp(tk.Tk):
             entry = f"[{now_str}] {text}\n"
             if task_id:
                 try:
-                    cur = self.db.conn.cursor()
-                    cur.execute("SELECT progress_log FROM tasks WHERE id=?", (task_id,))
-                    old = cur.fetchone()[0] or ""
-                    new_log = entry + old
-                    self.db.update_progress(task_id, new_log)
-                    progress_display.config(state="normal")
-                    progress_display.delete("1.0", tk.END)
-                    progress_display.insert(tk.END, new_log)
-                    progress_display.config(state="disabled")
-                    new_progress_entry.delete("1.0", tk.END)
-                    self._populate(); self._populate_kanban()
+                    self.db.prepend_progress(task_id, entry)
                 except Exception:
                     logger.exception("Could not add progress")
                     messagebox.showerror("Progress Error", "Could not add progress", parent=win)
+                    return
             else:
+                # new task: written by _save along with the rest of the form
                 staged_progress_entries = entry + staged_progress_entries
-                progress_display.config(state="normal")
-                progress_display.delete("1.0", tk.END)
-                progress_display.insert(tk.END, staged_progress_entries)
-                progress_display.config(state="disabled")
-                new_progress_entry.delete("1.0", tk.END)
+            # newest entry goes on top: insert it rather than reloading the whole log
+            progress_display.config(state="normal")
+            progress_display.insert("1.0", entry)
+            progress_display.config(state="disabled")
+            new_progress_entry.delete("1.0", tk.END)
 
         ttk.Button(progress_frame, text="Add Progress Entry", command=lambda: _add_progress_entry_from_text(new_progress_entry.get("1.0", tk.END))).pack(pady=(6, 0))
         row += 1
@@ -2016,14 +2659,10 @@ class TaskApp(tk.Tk):
             # determine recipient
             label = responsible_var.get().strip()
             to_address = None
-            if label and hasattr(responsible_cb, "lookup_map"):
-                cid = responsible_cb.lookup_map.get(label)
+            if label:
+                cid = self._contacts_label_to_id.get(label)
                 if cid:
-                    cur = self.db.conn.cursor()
-                    cur.execute("SELECT email FROM contacts WHERE id=?", (cid,))
-                    rowc = cur.fetchone()
-                    if rowc and rowc["email"]:
-                        to_address = rowc["email"]
+                    to_address = self.db.get_contact_email(cid) or None
             if not to_address:
                 # ask user to enter an email address
                 to_address = simpledialog.askstring("Recipient", "Enter recipient email address:", parent=win)
@@ -2034,11 +2673,19 @@ class TaskApp(tk.Tk):
             if not HAS_OUTLOOK:
                 messagebox.showwarning("Outlook Unavailable", "Outlook integration is not available on this system.")
                 return
-            sent_ok = self._send_reminder_email(task_id or 0, to_address, title_var.get().strip() or "Task Reminder", html_body)
-            if sent_ok:
-                messagebox.showinfo("Sent", f"Reminder email sent to {to_address}.", parent=win)
-            else:
-                messagebox.showerror("Send Failed", "Failed to send reminder email (see logs).", parent=win)
+            def _send_done(sent_ok):
+                # the editor may have been closed while Outlook was sending
+                parent = win if win.winfo_exists() else self
+                if parent is win:
+                    send_btn.config(state="normal")
+                if sent_ok:
+                    messagebox.showinfo("Sent", f"Reminder email sent to {to_address}.", parent=parent)
+                else:
+                    messagebox.showerror("Send Failed", "Failed to send reminder email (see logs).", parent=parent)
+
+            # one send at a time per editor; re-enabled when Outlook reports back
+            send_btn.config(state="disabled")
+            self._send_reminder_email(task_id or 0, to_address, title_var.get().strip() or "Task Reminder", html_body, on_done=_send_done)
         # ===== Outlook helper buttons (below editor) =====
         outlook_tools = ttk.Frame(content_frame)
         outlook_tools.grid(
@@ -2086,11 +2733,12 @@ class TaskApp(tk.Tk):
             pady=(12, 16)
         )
 
-        ttk.Button(
+        send_btn = ttk.Button(
             send_frame,
             text="Send Reminder Now (Outlook)",
             command=_send_now_action
-        ).pack()
+        )
+        send_btn.pack()
 
         
 
@@ -2113,50 +2761,43 @@ class TaskApp(tk.Tk):
         attachments_label.pack(anchor="w", fill=tk.X)
 
         def add_file_to_attachments():
+            nonlocal pending_copies
+            from tkinter import filedialog
             path = filedialog.askopenfilename(parent=win)
             if not path:
                 return
-            os.makedirs("attachments", exist_ok=True)
-            fname = os.path.basename(path)
-            dest = os.path.join("attachments", fname)
-            if os.path.exists(dest):
-                base, ext = os.path.splitext(fname)
-                dest = os.path.join("attachments", f"{base}_{int(datetime.now().timestamp())}{ext}")
-            with open(path, "rb") as fsrc, open(dest, "wb") as fdst:
-                fdst.write(fsrc.read())
-            if task_id:
-                cur = self.db.conn.cursor()
-                cur.execute("SELECT attachments FROM tasks WHERE id=?", (task_id,))
-                rowa = cur.fetchone()
-                files = []
-                if rowa and rowa["attachments"]:
-                    try:
-                        files = json.loads(rowa["attachments"])
-                    except Exception:
-                        files = []
-                files.append(dest)
-                self.db.conn.execute("UPDATE tasks SET attachments=? WHERE id=?", (json.dumps(files), task_id))
-                self.db.conn.commit()
-                attachments_list_var.set(", ".join(os.path.basename(p) for p in files))
-            else:
+
+            def _copied(dest):
+                nonlocal pending_copies
+                pending_copies -= 1
+                if not win.winfo_exists():
+                    # editor closed while copying; nothing will reference the copy
+                    if dest:
+                        try:
+                            os.remove(dest)
+                        except Exception:
+                            logger.exception("Could not remove unused attachment copy: %s", dest)
+                    return
+                if not pending_copies:
+                    save_btn.config(state="normal")
+                if dest is None:
+                    messagebox.showerror("Attachment", "Could not copy the file.", parent=win)
+                    return
+                # recorded on the task by _save, in the same write as the rest of the form
                 staged_attachments.append(dest)
-                attachments_list_var.set(", ".join(os.path.basename(p) for p in staged_attachments))
+                attachments_list_var.set(", ".join(os.path.basename(p) for p in existing_attachments + staged_attachments))
+
+            # Save stays disabled until every copy has landed in staged_attachments
+            pending_copies += 1
+            save_btn.config(state="disabled")
+            self._copy_to_attachments(path, _copied)
 
         def open_attachments():
             files = list(existing_attachments) + list(staged_attachments)
             if not files:
                 messagebox.showinfo("Attachments", "No attachments to open.", parent=win)
                 return
-            for f in files:
-                try:
-                    if os.name == "nt":
-                        os.startfile(f)
-                    elif sys.platform == "darwin":
-                        subprocess.run(["open", f])
-                    else:
-                        subprocess.run(["xdg-open", f])
-                except Exception:
-                    logger.exception("Could not open attachment")
+            self._open_files(files)
 
         btns_attach = ttk.Frame(attachments_frame)
         btns_attach.pack(anchor="w", pady=(6, 0))
@@ -2167,9 +2808,7 @@ class TaskApp(tk.Tk):
         # If editing existing task, load values now
         if task_id:
             try:
-                cur = self.db.conn.cursor()
-                cur.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
-                r = cur.fetchone()
+                r = self.db.get_task(task_id)
                 if r:
                     title_var.set(r["title"])
                     due_var.set(r["due_date"] or "")
@@ -2191,17 +2830,8 @@ class TaskApp(tk.Tk):
                         progress_display.config(state="disabled")
                     rec_val = (r["recurrence"] or "").strip().lower()
                     if rec_val and rec_val != "none":
-                        parsed = self._parse_recurrence(rec_val)
-                        typ = parsed.get("type")
-                        n = parsed.get("n", 1)
-                        if typ == "days":
-                            rec_type_var.set("Every N days")
-                        elif typ == "weeks":
-                            rec_type_var.set("Every N weeks")
-                        elif typ == "months":
-                            rec_type_var.set("Every N months")
-                        else:
-                            rec_type_var.set("None")
+                        typ, n = _parse_recurrence_cached(rec_val)
+                        rec_type_var.set(RECURRENCE_LABELS.get(typ, "None"))
                         rec_n_var.set(str(n))
                     else:
                         rec_type_var.set("None")
@@ -2237,7 +2867,27 @@ class TaskApp(tk.Tk):
             except Exception:
                 pass
 
+        def _cancel():
+            # staged attachments are already copied into ./attachments; with no
+            # Save, nothing would reference them
+            if staged_attachments or staged_progress_entries or pending_copies:
+                if not messagebox.askyesno(
+                    "Discard Changes",
+                    "Discard the attachments and progress entries added in this window?",
+                    parent=win,
+                ):
+                    return
+            for path in staged_attachments:
+                try:
+                    os.remove(path)
+                except Exception:
+                    logger.exception("Could not remove unused attachment copy: %s", path)
+            _close()
+
         def _save():
+            if pending_copies:
+                messagebox.showwarning("Attachments", "Please wait for the attachment copy to finish.", parent=win)
+                return
             title = title_var.get().strip()
             if not title:
                 messagebox.showwarning("Validation", "Title is required", parent=win)
@@ -2269,57 +2919,35 @@ class TaskApp(tk.Tk):
             except Exception:
                 messagebox.showwarning("Validation", "Recurrence interval N must be an integer >= 1.", parent=win)
                 return
-            if rec_type_label == "Every N days":
-                rec_store = f"days:{n_val}"
-            elif rec_type_label == "Every N weeks":
-                rec_store = f"weeks:{n_val}"
-            elif rec_type_label == "Every N months":
-                rec_store = f"months:{n_val}"
-            else:
-                rec_store = "none"
+            rec_typ = RECURRENCE_TYPES.get(rec_type_label)
+            rec_store = f"{rec_typ}:{n_val}" if rec_typ else "none"
 
             # determine responsible id
             responsible_label = responsible_var.get().strip()
             responsible_id_val = None
-            if responsible_label and hasattr(responsible_cb, "lookup_map"):
-                responsible_id_val = responsible_cb.lookup_map.get(responsible_label)
+            if responsible_label:
+                responsible_id_val = self._contacts_label_to_id.get(responsible_label)
 
             reminder_email_html = email_body_text.get("1.0", tk.END).strip() or None
             try:
+                # attachments are written in the same statement as the task itself
                 if task_id:
                     self.db.update(task_id, title, desc, due or None, priority_var.get(), status_var.get(),
                                 reminder_minutes=reminder_minutes_int, reminder_set_at=reminder_set_at_iso, recurrence=rec_store,
-                                responsible_id=responsible_id_val, reminder_email_body=reminder_email_html)
-                    if staged_attachments:
-                        cur = self.db.conn.cursor()
-                        cur.execute("SELECT attachments FROM tasks WHERE id=?", (task_id,))
-                        rowa = cur.fetchone()
-                        files = []
-                        if rowa and rowa["attachments"]:
-                            try:
-                                files = json.loads(rowa["attachments"])
-                            except Exception:
-                                files = []
-                        files.extend(staged_attachments)
-                        self.db.conn.execute("UPDATE tasks SET attachments=? WHERE id=?", (json.dumps(files), task_id))
+                                responsible_id=responsible_id_val, reminder_email_body=reminder_email_html,
+                                add_attachments=staged_attachments)
                 else:
                     self.db.add(title, desc, due or None, priority_var.get(), status_var.get(),
                                 reminder_minutes=reminder_minutes_int, reminder_set_at=reminder_set_at_iso, recurrence=rec_store,
-                                responsible_id=responsible_id_val, reminder_email_body=reminder_email_html)
-                    cur = self.db.conn.cursor()
-                    cur.execute("SELECT last_insert_rowid() as id")
-                    new_id = cur.fetchone()["id"]
-                    if staged_attachments:
-                        self.db.conn.execute("UPDATE tasks SET attachments=? WHERE id=?", (json.dumps(staged_attachments), new_id))
-                    if staged_progress_entries:
-                        self.db.update_progress(new_id, staged_progress_entries)
+                                responsible_id=responsible_id_val, reminder_email_body=reminder_email_html,
+                                attachments=json.dumps(staged_attachments) if staged_attachments else None,
+                                progress_log=staged_progress_entries or None)
             except Exception:
                 logger.exception("Save Error")
                 messagebox.showerror("Save Error", "Could not save task", parent=win)
                 return
 
-            self._populate()
-            self._populate_kanban()
+            self._request_refresh()
             _close()
 
         #btn_frame = ttk.Frame(bottom_frame)
@@ -2329,17 +2957,19 @@ class TaskApp(tk.Tk):
         footer = ttk.Frame(win, padding=10)
         footer.pack(side=tk.BOTTOM, fill=tk.X)
 
-        ttk.Button(
+        save_btn = ttk.Button(
             footer,
             text="Save",
             command=_save
-        ).pack(side=tk.LEFT, padx=8)
+        )
+        save_btn.pack(side=tk.LEFT, padx=8)
 
         ttk.Button(
             footer,
             text="Cancel",
-            command=win.destroy
+            command=_cancel
         ).pack(side=tk.LEFT, padx=8)
+        win.protocol("WM_DELETE_WINDOW", _cancel)
 
         
 
@@ -2353,8 +2983,26 @@ class TaskApp(tk.Tk):
         except Exception:
             pass
 
+        # Configure fires for every child and every pixel of a drag; coalesce
+        # them into one scrollregion update once resizing pauses
+        resize_after_id = None
+
         def _on_win_configure(event=None):
-            _on_frame_configure()
+            nonlocal resize_after_id
+            if resize_after_id:
+                try:
+                    win.after_cancel(resize_after_id)
+                except Exception:
+                    pass
+            resize_after_id = win.after(50, _run_frame_configure)
+
+        def _run_frame_configure():
+            nonlocal resize_after_id
+            resize_after_id = None
+            try:
+                _on_frame_configure()
+            except Exception:
+                pass
         win.bind("<Configure>", _on_win_configure)
 
     ###
@@ -2370,20 +3018,8 @@ class TaskApp(tk.Tk):
         try:
             if not rec_str:
                 return {"type": "none", "n": 0}
-            s = str(rec_str).strip().lower()
-            if s in ("none", ""):
-                return {"type": "none", "n": 0}
-            if ":" in s:
-                typ, n = s.split(":", 1)
-                typ = typ.strip()
-                try:
-                    n = max(1, int(n))
-                except Exception:
-                    n = 1
-                if typ in ("days", "weeks", "months"):
-                    return {"type": typ, "n": n}
-            # fallback
-            return {"type": "none", "n": 0}
+            typ, n = _parse_recurrence_cached(str(rec_str).strip().lower())
+            return {"type": typ, "n": n}
         except Exception:
             return {"type": "none", "n": 0}
 
@@ -2400,7 +3036,7 @@ class TaskApp(tk.Tk):
             n = parsed.get("n", 0) or 0
             if typ == "none" or n <= 0:
                 return None
-            cur_due = datetime.strptime(due_date_iso, "%Y-%m-%d").date()
+            cur_due = date.fromisoformat(due_date_iso)
             if typ == "days":
                 next_due = cur_due + timedelta(days=n)
             elif typ == "weeks":
@@ -2412,7 +3048,10 @@ class TaskApp(tk.Tk):
                 # normalize year/month
                 year += (month - 1) // 12
                 month = ((month - 1) % 12) + 1
-                day = min(cur_due.day, calendar.monthrange(year, month)[1])
+                dim = DAYS_IN_MONTH[month - 1]
+                if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+                    dim = 29
+                day = cur_due.day if cur_due.day <= dim else dim
                 next_due = date(year, month, day)
             else:
                 return None
@@ -2430,59 +3069,95 @@ class TaskApp(tk.Tk):
         except Exception:
             return None
 
-    def _open_selected_kanban_attachments(self):
-        if not self.kanban_selected_id:
-            messagebox.showwarning("No Task", "Please select a task first.")
-            return
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT attachments FROM tasks WHERE id=?", (self.kanban_selected_id,))
-        row = cur.fetchone()
-        if not row or not row["attachments"]:
-            messagebox.showinfo("No Attachments", "No attachments found for this task.")
-            return
-        files = json.loads(row["attachments"])
+    def _open_files(self, files):
+        """
+        Open each file with the system handler. Launchers are started without
+        waiting so several attachments open together and the UI stays responsive.
+        """
+        import subprocess
         for f in files:
             try:
                 if os.name == "nt":
                     os.startfile(f)
                 elif sys.platform == "darwin":
-                    subprocess.run(["open", f])
+                    subprocess.Popen(["open", f])
                 else:
-                    subprocess.run(["xdg-open", f])
+                    subprocess.Popen(["xdg-open", f])
             except Exception:
                 logger.exception("Could not open attachment")
 
-    def _add_attachment(self):
-        path = filedialog.askopenfilename()
-        if not path:
+    def _open_selected_kanban_attachments(self):
+        if not self.kanban_selected_id:
+            messagebox.showwarning("No Task", "Please select a task first.")
+            return
+        files = self.db.get_attachments(self.kanban_selected_id)
+        if not files:
+            messagebox.showinfo("No Attachments", "No attachments found for this task.")
+            return
+        self._open_files(files)
+
+    def _copy_to_attachments(self, path, on_done):
+        """
+        Copy `path` into ./attachments (renamed on a name clash) on a worker
+        thread, so a large file doesn't freeze the UI. on_done(dest) runs on
+        the Tk thread afterwards, with dest=None if the copy failed.
+        """
+        try:
+            os.makedirs("attachments", exist_ok=True)
+        except Exception:
+            logger.exception("Could not create attachments folder")
+            on_done(None)
             return
-        os.makedirs("attachments", exist_ok=True)
         fname = os.path.basename(path)
         dest = os.path.join("attachments", fname)
         if os.path.exists(dest):
             base, ext = os.path.splitext(fname)
             dest = os.path.join("attachments", f"{base}_{int(datetime.now().timestamp())}{ext}")
-        with open(path, "rb") as fsrc, open(dest, "wb") as fdst:
-            fdst.write(fsrc.read())
+
+        result = []
+
+        def _work():
+            try:
+                shutil.copyfile(path, dest)
+                result.append(dest)
+            except Exception:
+                logger.exception("Attachment copy failed: %s", path)
+                result.append(None)
+
+        threading.Thread(target=_work, daemon=True).start()
+
+        def _poll():
+            if not result:
+                self.after(50, _poll)
+                return
+            on_done(result[0])
+
+        self.after(50, _poll)
+
+    def _add_attachment(self):
         sel = self.tree.selection()
         if not sel:
             messagebox.showwarning("No Task", "Select a task first.")
             return
         task_id = int(self.tree.item(sel[0], "values")[0])
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT attachments FROM tasks WHERE id=?", (task_id,))
-        row = cur.fetchone()
-        files = []
-        if row and row["attachments"]:
+        from tkinter import filedialog
+        path = filedialog.askopenfilename()
+        if not path:
+            return
+
+        def _copied(dest):
+            if dest is None:
+                messagebox.showerror("Attachment", "Could not copy the file.")
+                return
             try:
-                files = json.loads(row["attachments"])
+                files = self.db.append_attachment(task_id, dest)
             except Exception:
-                files = []
-        files.append(dest)
-        self.db.conn.execute("UPDATE tasks SET attachments=? WHERE id=?", (json.dumps(files), task_id))
-        self.db.conn.commit()
-        self.attachments_var.set(", ".join(os.path.basename(f) for f in files))
-        messagebox.showinfo("Attachment", f"File {os.path.basename(dest)} added.")
+                logger.exception("Could not record attachment")
+                return
+            self.attachments_var.set(", ".join(os.path.basename(f) for f in files))
+            messagebox.showinfo("Attachment", f"File {os.path.basename(dest)} added.")
+
+        self._copy_to_attachments(path, _copied)
 
     def _open_attachment(self):
         sel = self.tree.selection()
@@ -2490,23 +3165,11 @@ class TaskApp(tk.Tk):
             messagebox.showwarning("No Task", "Select a task first.")
             return
         task_id = int(self.tree.item(sel[0], "values")[0])
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT attachments FROM tasks WHERE id=?", (task_id,))
-        row = cur.fetchone()
-        if not row or not row["attachments"]:
+        files = self.db.get_attachments(task_id)
+        if not files:
             messagebox.showinfo("No Attachments", "No attachments found for this task.")
             return
-        files = json.loads(row["attachments"])
-        for f in files:
-            try:
-                if os.name == "nt":
-                    os.startfile(f)
-                elif sys.platform == "darwin":
-                    subprocess.run(["open", f])
-                else:
-                    subprocess.run(["xdg-open", f])
-            except Exception:
-                logger.exception("Could not open attachment")
+        self._open_files(files)
 
     def _on_kanban_drag_start(self, event):
         lb = event.widget
@@ -2517,12 +3180,15 @@ class TaskApp(tk.Tk):
     ##
     # add this method to TaskApp (anywhere inside the class)
     def _global_kanban_double_click(self, event):
+        # the widget-chain trace below is only built when it will be written
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            logger.debug("global handler invoked: widget=%s coords=(%s,%s) type=%s",
-                        getattr(event, "widget", None),
-                        getattr(event, "x_root", None),
-                        getattr(event, "y_root", None),
-                        getattr(event, "type", None))
+            if debug:
+                logger.debug("global handler invoked: widget=%s coords=(%s,%s) type=%s",
+                            getattr(event, "widget", None),
+                            getattr(event, "x_root", None),
+                            getattr(event, "y_root", None),
+                            getattr(event, "type", None))
 
             x = getattr(event, "x_root", None)
             y = getattr(event, "y_root", None)
@@ -2568,10 +3234,12 @@ class TaskApp(tk.Tk):
             cur = widget
             chain = []
             while cur:
-                chain.append(str(cur))
+                if debug:
+                    chain.append(str(cur))
                 try:
                     tid = getattr(cur, "_kanban_task_id", None)
-                    logger.debug("checking widget %s for _kanban_task_id -> %s", cur, tid)
+                    if debug:
+                        logger.debug("checking widget %s for _kanban_task_id -> %s", cur, tid)
                     if tid:
                         try:
                             tid_int = int(tid)
@@ -2591,7 +3259,8 @@ class TaskApp(tk.Tk):
                 except Exception:
                     break
 
-            logger.debug("No kanban task id found in parent chain. widget chain: %s", " -> ".join(chain))
+            if debug:
+                logger.debug("No kanban task id found in parent chain. widget chain: %s", " -> ".join(chain))
         except Exception:
             logger.exception("Unhandled error in global kanban double-click handler")
 
@@ -2637,6 +3306,8 @@ class TaskApp(tk.Tk):
         src_lb = self.drag_data["listbox"]
         src_status = src_lb.status_name
         src_index = self.drag_data["index"]
+        # the line removed from the source listbox is re-used as-is on drop
+        display = self.drag_data.get("task_line") or "Untitled"
         try:
             task_id = self.kanban_item_map[src_status][src_index]
         except Exception:
@@ -2652,24 +3323,14 @@ class TaskApp(tk.Tk):
         if target_lb and hasattr(target_lb, "status_name"):
             target_status = target_lb.status_name
             try:
-                cur = self.db.conn.cursor()
-                cur.execute("SELECT title FROM tasks WHERE id=?", (task_id,))
-                row = cur.fetchone()
-                display = row["title"] if row else "Untitled"
                 target_lb.insert(tk.END, display)
             except Exception:
-                try:
-                    target_lb.insert(tk.END, "Untitled")
-                except Exception:
-                    pass
+                pass
             self.kanban_item_map[target_status].append(task_id)
             self._move_task(task_id, target_status)
         else:
             try:
-                cur = self.db.conn.cursor()
-                row = cur.execute("SELECT title FROM tasks WHERE id=?", (task_id,)).fetchone()
-                title = row["title"] if row else "Untitled"
-                src_lb.insert(tk.END, title)
+                src_lb.insert(tk.END, display)
                 self.kanban_item_map[src_status].append(task_id)
             except Exception:
                 pass
@@ -2745,7 +3406,23 @@ class TaskApp(tk.Tk):
             return
         self._open_edit_window(task_id)
 
+    def _schedule_apply_filters(self, delay_ms=250):
+        """Apply the filters once typing pauses for `delay_ms`, instead of on every keystroke."""
+        if self._filter_after_id is not None:
+            try:
+                self.after_cancel(self._filter_after_id)
+            except Exception:
+                pass
+        self._filter_after_id = self.after(delay_ms, self._apply_filters)
+
     def _apply_filters(self):
+        if self._filter_after_id is not None:
+            # an explicit apply supersedes a pending debounced one
+            try:
+                self.after_cancel(self._filter_after_id)
+            except Exception:
+                pass
+            self._filter_after_id = None
         fd = self.filter_due_var.get().strip() if hasattr(self, "filter_due_var") else ""
         if fd:
             try:
@@ -2766,6 +3443,10 @@ class TaskApp(tk.Tk):
             self._populate_trash()
         except Exception:
             logger.exception("Error populating Trash from _apply_filters")
+        try:
+            self._populate_future_tasks()
+        except Exception:
+            logger.exception("Error populating Future Tasks from _apply_filters")
 
     def _clear_filters(self):
         if hasattr(self, "filter_text_var"):
@@ -2778,57 +3459,68 @@ class TaskApp(tk.Tk):
             self.filter_due_var.set("")
         self._populate()
 
+    def _request_refresh(self):
+        """
+        Schedule one Task List + Kanban refresh for when Tk is idle. Several
+        mutations in the same event handler collapse into a single rebuild.
+        """
+        if self._ui_dirty:
+            return
+        self._ui_dirty = True
+        self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._ui_dirty = False
+        self._populate()
+        self._populate_kanban()
+        # task data changed, possibly reminder times the row values don't show
+        self._schedule_reminder_display(0)
+
+    def _current_filters(self):
+        """
+        Global filter bar values as keyword arguments for TaskDB.fetch()/fetch_kanban().
+        """
+        def _get(name, default):
+            var = getattr(self, name, None)
+            return var.get() if var is not None else default
+
+        fpri = _get("filter_priority_var", "All")
+        fstat = _get("filter_status_var", "All")
+        return {
+            "text": _get("filter_text_var", "").strip() or None,
+            "priority": fpri if fpri and fpri != "All" else None,
+            "status": fstat if fstat and fstat != "All" else None,
+            "due": _get("filter_due_var", "").strip() or None,
+            "show_completed": _get("filter_show_completed_var", "Yes") != "No",
+        }
+
     def _populate(self):
         try:
-            for rowid in self.tree.get_children():
-                self.tree.delete(rowid)
-        except Exception:
-            pass
-        try:
-            rows = self.db.fetch()
+            rows = self.db.fetch(
+                **self._current_filters(),
+                order_by=self._sort_col,
+                desc=self._sort_state.get(self._sort_col, False),
+            )
         except Exception:
+            logger.exception("Error fetching tasks for Task List")
             rows = []
+        labels = self.db.get_contact_labels()
+        # column set is the same for every row, so check it once
+        has_reminder = ("reminder_minutes" in rows[0].keys()) if rows else True
 
-        ft = (self.filter_text_var.get().strip().lower() if hasattr(self, "filter_text_var") else "").strip()
-        fpri = (self.filter_priority_var.get() if hasattr(self, "filter_priority_var") else "All")
-        fstat = (self.filter_status_var.get() if hasattr(self, "filter_status_var") else "All")
-        fdue = (self.filter_due_var.get().strip() if hasattr(self, "filter_due_var") else "").strip()
-        fshow_completed = (self.filter_show_completed_var.get() if hasattr(self, "filter_show_completed_var") else "Yes")
-
-        def row_matches(r):
-            if ft:
-                hay = ((r["title"] or "") + " " + (r["description"] or "")).lower()
-                if ft not in hay:
-                    return False
-            if fpri and fpri != "All":
-                if (r["priority"] or "") != fpri:
-                    return False
-            if fstat and fstat != "All":
-                if (r["status"] or "") != fstat:
-                    return False
-            if fdue:
-                try:
-                    if (r["due_date"] or "") != fdue:
-                        return False
-                except Exception:
-                    return False
-            return True
-
+        # iid -> (values, tags) for every row that should be visible after this refresh
+        new_rows = {}
+        order = []
         insert_index = 0
         for r in rows:
             try:
                 status_val = (r["status"] or "").strip()
-                if fshow_completed == "No" and status_val.lower() == "done":
-                    continue
-                if not row_matches(r):
-                    continue
                 desc = r["description"] or ""
-                desc_preview = desc.replace("<body>", "").replace("</body>", "").replace("<html>", "").replace("</html>", "")
-                desc_preview = desc_preview.replace("\n", " ")
+                desc_preview = self._PREVIEW_RE.sub("", desc).replace("\n", " ")
                 if len(desc_preview) > 80:
                     desc_preview = desc_preview[:80] + "..."
 
-                reminder_val = r["reminder_minutes"] if "reminder_minutes" in r.keys() else None
+                reminder_val = r["reminder_minutes"] if has_reminder else None
                 reminder_display = str(reminder_val) if reminder_val not in (None, "", "None") else "—"
 
                 title_display = r["title"] or ""
@@ -2836,7 +3528,7 @@ class TaskApp(tk.Tk):
 
                 is_done = status_val.lower() == "done"
 
-                responsible_label = self.db.get_contact_label(r["responsible_id"]) if r["responsible_id"] else ""
+                responsible_label = labels.get(r["responsible_id"], "") if r["responsible_id"] else ""
 
                 if self.settings.get("show_description", False):
                     values = [
@@ -2872,26 +3564,81 @@ class TaskApp(tk.Tk):
                     tags.append("priority_low")
                 tags.append("evenrow" if insert_index % 2 == 0 else "oddrow")
 
-                try:
-                    iid = self.tree.insert("", tk.END, values=values, tags=tags)
-                    if is_done:
-                        try:
-                            self.tree.tag_configure("completed", foreground="#666666")
-                            if hasattr(self, "strike_font"):
-                                self.tree.tag_configure("completed", font=self.strike_font)
-                        except Exception:
-                            pass
-                except Exception:
-                    try:
-                        self.tree.insert("", tk.END, values=values)
-                    except Exception:
-                        pass
-
+                iid = str(r["id"])
+                new_rows[iid] = (tuple(values), tuple(tags))
+                order.append(iid)
                 insert_index += 1
             except Exception:
                 logger.exception("Error inserting row in _populate")
                 continue
 
+        try:
+            self._apply_tree_diff(new_rows, order)
+        except Exception:
+            # tree and cache out of sync: fall back to a full rebuild
+            logger.exception("Incremental Task List refresh failed; rebuilding")
+            try:
+                self.tree.delete(*self.tree.get_children())
+            except Exception:
+                pass
+            self._last_rows = {}
+            self._last_reminder_text = {}
+            self._apply_tree_diff(new_rows, order)
+
+    def _init_tree_tags(self):
+        """
+        Configure the Task List row tags once; _populate only attaches them.
+        """
+        try:
+            self.tree.tag_configure("priority_high", background="#FFD6D6")
+            self.tree.tag_configure("priority_medium", background="#FFF5CC")
+            self.tree.tag_configure("priority_low", background="#E6FFEA")
+            self.tree.tag_configure("oddrow", background="#FFFFFF")
+            self.tree.tag_configure("evenrow", background="#F6F6F6")
+            self.tree.tag_configure("completed", foreground="#666666")
+            if hasattr(self, "strike_font"):
+                self.tree.tag_configure("completed", font=self.strike_font)
+        except Exception:
+            pass
+
+    def _apply_tree_diff(self, new_rows, order):
+        """
+        Bring self.tree in line with new_rows (iid -> (values, tags)) touching
+        only the rows that were added, removed or changed since the last refresh.
+        """
+        touched = False
+        stale = [iid for iid in self._last_rows if iid not in new_rows]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                self._last_reminder_text.pop(iid, None)
+
+        for iid in order:
+            values, tags = new_rows[iid]
+            prev = self._last_rows.get(iid)
+            if prev is None:
+                self.tree.insert("", tk.END, iid=iid, values=values, tags=tags)
+                self._last_reminder_text.pop(iid, None)
+                touched = True
+            elif prev[0] != values:
+                # one item() call rewrites the row instead of a set() per changed cell;
+                # the reminder cell is rewritten too, so let the ticker redraw it
+                self.tree.item(iid, values=values, tags=tags)
+                self._last_reminder_text.pop(iid, None)
+                touched = True
+            elif prev[1] != tags:
+                self.tree.item(iid, tags=tags)
+
+        # restore display order only when it actually differs; set_children
+        # reorders the whole list in one Tcl call instead of a move() per row
+        if list(self.tree.get_children()) != order:
+            self.tree.set_children("", *order)
+
+        self._last_rows = new_rows
+        if touched:
+            # new or rewritten rows show the raw reminder value until the ticker runs
+            self._schedule_reminder_display(0)
+
     ####
     def _kanban_click_select(self, event, lb):
         """
@@ -2921,9 +3668,7 @@ class TaskApp(tk.Tk):
             self.kanban_selected_status = status
 
             # populate details panel (reuse existing logic)
-            cur = self.db.conn.cursor()
-            cur.execute("SELECT description, progress_log, outlook_id, attachments FROM tasks WHERE id=?", (task_id,))
-            row = cur.fetchone()
+            row = self.db.get_details(task_id)
             if not row:
                 return
             desc = row["description"] or ""
@@ -2931,18 +3676,8 @@ class TaskApp(tk.Tk):
             outlook_id = row["outlook_id"]
 
             # show HTML if available else plain text (reuse your code path)
-            if outlook_id and HAS_HTML:
-                clean = desc or ""
-                clean = re.sub(r'<style.*?>.*?</style>', '', clean, flags=re.DOTALL | re.IGNORECASE)
-                clean = re.sub(r'<font[^>]*>', '', clean, flags=re.IGNORECASE).replace("</font>", "")
-                clean = re.sub(r'style="[^"]*font-size:[^";]*;?"', '', clean, flags=re.IGNORECASE)
-                clean = re.sub(r'style="[^"]*font-family:[^";]*;?"', '', clean, flags=re.IGNORECASE)
-                clean = re.sub(r'<span[^>]*>', '<span>', clean, flags=re.IGNORECASE)
-                if os.name == "nt":
-                    wrapper_style = "font-family:Segoe UI, Arial; font-size:9pt; line-height:1.3; color:#333;"
-                else:
-                    wrapper_style = "font-family:Arial; font-size:11px; line-height:1.3; color:#333;"
-                clean = f"<div style='{wrapper_style}'>{clean}</div>"
+            if outlook_id and HAS_HTML:
+                clean = _clean_kanban_html(desc)
                 try:
                     # switch to HTML label if present
                     if hasattr(self, "kanban_text") and self.kanban_text is not None:
@@ -3110,9 +3845,7 @@ class TaskApp(tk.Tk):
                             break
 
                     # populate details panel
-                    cur = self.db.conn.cursor()
-                    cur.execute("SELECT description, progress_log, outlook_id, attachments FROM tasks WHERE id=?", (_id,))
-                    row = cur.fetchone()
+                    row = self.db.get_details(_id)
                     if not row:
                         return
                     desc = row["description"] or ""
@@ -3125,17 +3858,7 @@ class TaskApp(tk.Tk):
 
                     # show HTML if available else plain text (reuse your code path)
                     if outlook_id and HAS_HTML:
-                        clean = desc or ""
-                        clean = re.sub(r'<style.*?>.*?</style>', '', clean, flags=re.DOTALL | re.IGNORECASE)
-                        clean = re.sub(r'<font[^>]*>', '', clean, flags=re.IGNORECASE).replace("</font>", "")
-                        clean = re.sub(r'style="[^"]*font-size:[^";]*;?"', '', clean, flags=re.IGNORECASE)
-                        clean = re.sub(r'style="[^"]*font-family:[^";]*;?"', '', clean, flags=re.IGNORECASE)
-                        clean = re.sub(r'<span[^>]*>', '<span>', clean, flags=re.IGNORECASE)
-                        if os.name == "nt":
-                            wrapper_style = "font-family:Segoe UI, Arial; font-size:9pt; line-height:1.3; color:#333;"
-                        else:
-                            wrapper_style = "font-family:Arial; font-size:11px; line-height:1.3; color:#333;"
-                        clean = f"<div style='{wrapper_style}'>{clean}</div>"
+                        clean = _clean_kanban_html(desc)
                         try:
                             if hasattr(self, "kanban_text") and self.kanban_text is not None:
                                 try:
@@ -3243,93 +3966,108 @@ class TaskApp(tk.Tk):
 
     ####------------------ Kanban Board --------------------            
     def _populate_kanban(self):
-        # clear existing contents
-        try:
-            for status, colinfo in self.kanban_columns.items():
-                inner = colinfo["frame"]
-                # destroy all children inside inner
-                for child in list(inner.winfo_children()):
-                    child.destroy()
-                self.kanban_item_map[status] = []
-        except Exception:
-            self.kanban_item_map = {status: [] for status in STATUSES}
-
-        
-        ###
+        # single filtered fetch with only the columns the cards need
         try:
-            all_rows = self.db.fetch()
-            rows = [r for r in all_rows if not r["is_future"]]
+            all_rows = self.db.fetch_kanban(**self._current_filters())
         except Exception:
+            logger.exception("Error fetching tasks for Kanban")
             all_rows = []
 
-        ft = (self.filter_text_var.get().strip().lower() if hasattr(self, "filter_text_var") else "").strip()
-        fpri = (self.filter_priority_var.get() if hasattr(self, "filter_priority_var") else "All")
-        fstat = (self.filter_status_var.get() if hasattr(self, "filter_status_var") else "All")
-        fdue = (self.filter_due_var.get().strip() if hasattr(self, "filter_due_var") else "").strip()
-        fshow_completed = (self.filter_show_completed_var.get() if hasattr(self, "filter_show_completed_var") else "Yes")
-
-        def _row_matches_for_kanban(r):
-            if ft:
-                hay = ((r["title"] or "") + " " + (r["description"] or "")).lower()
-                if ft not in hay:
-                    return False
-            if fpri and fpri != "All":
-                if (r["priority"] or "") != fpri:
-                    return False
-            if fstat and fstat != "All":
-                if (r["status"] or "") != fstat:
-                    return False
-            if fdue:
-                try:
-                    if (r["due_date"] or "") != fdue:
-                        return False
-                except Exception:
-                    return False
-            if fshow_completed == "No" and (r["status"] or "").lower() == "done":
-                return False
-            return True
-
-        rows = [r for r in all_rows if _row_matches_for_kanban(r)]
-
-        groups = {}
-        for r in rows:
+        buckets = {status: [] for status in STATUSES}
+        for r in all_rows:
             try:
                 st = (r["status"] or "").strip()
-                matched = None
-                for s in STATUSES:
-                    if s.lower() == st.lower():
-                        matched = s
-                        break
-                if matched is None:
-                    matched = st or "Pending"
-                groups.setdefault(matched, []).append(r)
+                matched = self._status_lookup.get(st.lower(), st or "Pending")
+                if matched in buckets:
+                    buckets[matched].append(r)
             except Exception:
                 continue
-        ##            
-        today = date.today()
 
         for status in STATUSES:
-            colinfo = self.kanban_columns.get(status)
-            if not colinfo:
-                continue
+            self._kanban_data[status] = buckets[status]
+            self._render_kanban_column(status)
 
-            inner = colinfo["frame"]
-            canvas = colinfo["canvas"]
+    def _render_kanban_column(self, status):
+        """
+        Bring one Kanban column's cards in line with self._kanban_data[status].
+        Only the first self._kanban_limit[status] rows get card widgets; the
+        rest are created as the column is scrolled (see _on_kanban_yscroll).
+        """
+        colinfo = self.kanban_columns.get(status)
+        if not colinfo:
+            return
+        inner = colinfo["frame"]
+        rows = self._kanban_data.get(status, [])
+        # every id stays resolvable (selection status lookup), carded or not
+        self.kanban_item_map[status] = [r["id"] for r in rows]
+        items = rows[:self._kanban_limit.get(status, self.KANBAN_PAGE)]
+
+        # skip columns whose visible card content has not changed
+        signature = tuple(
+            (r["id"], r["title"], r["due_date"], r["priority"], r["responsible_id"]) for r in items
+        )
+        if self._kanban_rendered.get(status) == signature:
+            return
 
-            items = groups.get(status, [])
+        # reconcile by task id: cards that left the column or changed are
+        # destroyed, new ones created, unchanged cards are kept as-is
+        cards = self._kanban_cards.setdefault(status, {})
+        wanted = {sig[0]: sig for sig in signature}
+        for tid in list(cards):
+            wrapper, sig = cards[tid]
+            if wanted.get(tid) == sig:
+                continue
+            del cards[tid]
+            if self.kanban_card_widgets.get(tid) is wrapper:
+                del self.kanban_card_widgets[tid]
+            try:
+                wrapper.destroy()
+            except Exception:
+                pass
 
-            # --- CREATE CARDS (single loop only) ---
-            for r in items:
+        ids = []
+        for r, sig in zip(items, signature):
+            tid = sig[0]
+            if tid not in cards:
                 try:
                     wrapper = self._create_kanban_card(inner, r)
-                    if wrapper:
-                        self.kanban_item_map[status].append(r["id"])
                 except Exception:
                     logger.exception("Error creating kanban card")
+                    wrapper = None
+                if not wrapper:
+                    continue
+                cards[tid] = (wrapper, sig)
+            ids.append(tid)
 
-            # --- UPDATE SCROLL REGION ONCE ---
-            canvas.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
+        # re-pack only when the on-screen order differs (new cards land at the end)
+        ordered = [cards[tid][0] for tid in ids]
+        try:
+            if inner.pack_slaves() != ordered:
+                for w in ordered:
+                    w.pack_forget()
+                for w in ordered:
+                    w.pack(fill=tk.X, pady=(6, 4), padx=6)
+        except Exception:
+            logger.exception("Error ordering kanban cards")
+
+        self._kanban_rendered[status] = signature
+        # scrollregion follows from the inner frame's <Configure> binding
+
+    def _on_kanban_yscroll(self, status, scrollbar, lo, hi):
+        """yscrollcommand for a Kanban column: update the scrollbar, and add
+        the next page of cards once the bottom of the column comes into view."""
+        scrollbar.set(lo, hi)
+        try:
+            at_bottom = float(hi) >= 0.98
+        except (TypeError, ValueError):
+            return
+        limit = self._kanban_limit.get(status, self.KANBAN_PAGE)
+        # a column showing fewer cards than its limit is still waiting for that render
+        rendered = len(self._kanban_rendered.get(status, ()))
+        if at_bottom and rendered >= limit and limit < len(self._kanban_data.get(status, ())):
+            self._kanban_limit[status] = limit + self.KANBAN_PAGE
+            # render outside the canvas callback that reported the scroll
+            self.after_idle(self._render_kanban_column, status)
 
     def _kanban_select(self, event):
         lb = event.widget
@@ -3347,9 +4085,7 @@ class TaskApp(tk.Tk):
         self.kanban_selected_id = task_id
         self.kanban_selected_status = status
 
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT description, progress_log, outlook_id FROM tasks WHERE id=?", (task_id,))
-        row = cur.fetchone()
+        row = self.db.get_details(task_id)
         if not row:
             messagebox.showwarning("Error", "Task not found in database.")
             return
@@ -3358,17 +4094,7 @@ class TaskApp(tk.Tk):
         outlook_id = row["outlook_id"]
 
         if outlook_id and HAS_HTML:
-            clean = desc or ""
-            clean = re.sub(r'<style.*?>.*?</style>', '', clean, flags=re.DOTALL | re.IGNORECASE)
-            clean = re.sub(r'<font[^>]*>', '', clean, flags=re.IGNORECASE).replace("</font>", "")
-            clean = re.sub(r'style="[^"]*font-size:[^";]*;?"', '', clean, flags=re.IGNORECASE)
-            clean = re.sub(r'style="[^"]*font-family:[^";]*;?"', '', clean, flags=re.IGNORECASE)
-            clean = re.sub(r'<span[^>]*>', '<span>', clean, flags=re.IGNORECASE)
-            if os.name == "nt":
-                wrapper_style = "font-family:Segoe UI, Arial; font-size:9pt; line-height:1.3; color:#333;"
-            else:
-                wrapper_style = "font-family:Arial; font-size:11px; line-height:1.3; color:#333;"
-            clean = f"<div style='{wrapper_style}'>{clean}</div>"
+            clean = _clean_kanban_html(desc)
             try:
                 self.kanban_text.pack_forget()
             except Exception:
@@ -3388,10 +4114,8 @@ class TaskApp(tk.Tk):
         self.kanban_progress.delete("1.0", tk.END)
         self.kanban_progress.insert(tk.END, prog)
 
-        cur.execute("SELECT attachments FROM tasks WHERE id=?", (task_id,))
-        row2 = cur.fetchone()
-        if row2 and row2["attachments"]:
-            files = json.loads(row2["attachments"])
+        if row["attachments"]:
+            files = json.loads(row["attachments"])
             self.kanban_attachments_var.set(", ".join(os.path.basename(f) for f in files))
         else:
             self.kanban_attachments_var.set("No attachments")
@@ -3428,7 +4152,7 @@ class TaskApp(tk.Tk):
                 pass
             self.kanban_selected_id = None
             self.kanban_selected_status = None
-            self._populate(); self._populate_kanban(); self._populate_trash()
+            self._request_refresh(); self._populate_trash()
             return
 
         # Fallback — if someone left old Listbox-based kanban in place
@@ -3440,15 +4164,17 @@ class TaskApp(tk.Tk):
                 confirm = messagebox.askyesno("Confirm Delete", f"Move {len(sel)} selected task(s) to Trash?")
                 if not confirm:
                     return
-                for idx in sorted(sel, reverse=True):
+                task_ids = []
+                for idx in sel:
                     try:
-                        task_id = self.kanban_item_map[status][idx]
+                        task_ids.append(self.kanban_item_map[status][idx])
                     except Exception:
                         continue
-                    try:
-                        self.db.soft_delete(task_id)
-                    except Exception:
-                        logger.exception("Soft-delete error (kanban)")
+                try:
+                    self.db.soft_delete_many(task_ids)
+                except Exception:
+                    logger.exception("Soft-delete error (kanban)")
+                for idx in sorted(sel, reverse=True):
                     try:
                         lb.delete(idx)
                     except Exception:
@@ -3457,31 +4183,25 @@ class TaskApp(tk.Tk):
                         del self.kanban_item_map[status][idx]
                     except Exception:
                         pass
-        self._populate(); self._populate_kanban(); self._populate_trash()
+        self._request_refresh(); self._populate_trash()
 
     def _move_prev_selected(self):
         if not self.kanban_selected_id:
             return
-        idx = STATUSES.index(self.kanban_selected_status)
-        if idx > 0:
+        idx = STATUS_INDEX.get(self.kanban_selected_status)
+        if idx is not None and idx > 0:
             self._move_task(self.kanban_selected_id, STATUSES[idx - 1])
 
     def _move_next_selected(self):
         if not self.kanban_selected_id:
             return
-        idx = STATUSES.index(self.kanban_selected_status)
-        if idx < len(STATUSES) - 1:
+        idx = STATUS_INDEX.get(self.kanban_selected_status)
+        if idx is not None and idx < len(STATUSES) - 1:
             self._move_task(self.kanban_selected_id, STATUSES[idx + 1])
 
     def _move_task(self, task_id, new_status):
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
-        r = cur.fetchone()
-        if not r:
-            return
-        self.db.update(task_id, r["title"], r["description"], r["due_date"], r["priority"], new_status)
-        self._populate()
-        self._populate_kanban()
+        self.db.update_status(task_id, new_status)
+        self._request_refresh()
         self._sync_outlook_task(task_id, {"status": new_status}, action="update")
 
     def _update_progress(self):
@@ -3492,52 +4212,120 @@ class TaskApp(tk.Tk):
             return
         now = date.today().isoformat()
         entry = f"[{now}] {new_line}\n"
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT progress_log FROM tasks WHERE id=?", (self.kanban_selected_id,))
-        old = cur.fetchone()[0] or ""
-        new_log = entry + old
-        self.db.update_progress(self.kanban_selected_id, new_log)
+        new_log = self.db.prepend_progress(self.kanban_selected_id, entry)
         self.kanban_progress.delete("1.0", tk.END)
         self.kanban_progress.insert(tk.END, new_log)
-        self._populate_kanban()
+        # cards don't show progress, so the board needs no rebuild here
 
     # -------------------- Outlook integration --------------------
-    def _send_reminder_email(self, task_id, to_address, subject_title, html_body):
+    def _outlook_submit(self, job, on_done=None):
+        """
+        Run job(ol_app, ns) on the Outlook worker thread and pass its result to
+        on_done on the Tk thread. The worker has its own COM apartment and
+        Outlook objects, so jobs must not touch the database or any widget.
+        """
+        if self._outlook_worker is None:
+            self._outlook_worker = threading.Thread(target=self._outlook_worker_loop, daemon=True)
+            self._outlook_worker.start()
+        self._outlook_jobs.put((job, on_done))
+        self._outlook_pending += 1
+        if self._outlook_pending == 1:
+            self.after(100, self._poll_outlook_results)
+
+    def _outlook_worker_loop(self):
+        try:
+            import pythoncom  # type: ignore
+            pythoncom.CoInitialize()
+        except Exception:
+            logger.exception("Could not initialise COM on the Outlook worker")
+        ol_app = ns = None
+        while True:
+            job, on_done = self._outlook_jobs.get()
+            result = None
+            try:
+                if ol_app is not None:
+                    try:
+                        ol_app.Version
+                    except Exception:
+                        ol_app = ns = None
+                if ol_app is None:
+                    # connect once per worker and keep it, early-bound like _outlook_ns
+                    try:
+                        ol_app = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+                    except Exception:
+                        ol_app = win32com.client.Dispatch("Outlook.Application")
+                    ns = ol_app.GetNamespace("MAPI")
+                result = job(ol_app, ns)
+            except Exception:
+                logger.exception("Outlook worker job failed")
+            self._outlook_results.put((on_done, result))
+
+    def _poll_outlook_results(self):
+        while True:
+            try:
+                on_done, result = self._outlook_results.get_nowait()
+            except queue.Empty:
+                break
+            self._outlook_pending -= 1
+            if on_done is not None:
+                try:
+                    on_done(result)
+                except Exception:
+                    logger.exception("Outlook job callback failed")
+        if self._outlook_pending > 0:
+            self.after(100, self._poll_outlook_results)
+
+    def _send_reminder_email(self, task_id, to_address, subject_title, html_body, on_done=None):
         """
-        Send an HTML reminder email via Outlook to `to_address`.
+        Send an HTML reminder email via Outlook to `to_address` on the Outlook
+        worker thread, so the UI stays responsive while Outlook works.
         Behavior:
          - If a previous reminder was sent and we stored its EntryID (reminder_mail_entryid),
            reply to that message (Reply()) so Outlook keeps the conversation/thread.
          - Otherwise create a new mail using subject_title (no extra "Reminder:" prefix)
            and set ConversationTopic when possible, then store its EntryID for future replies.
-        Returns True on success, False otherwise.
+        `on_done(ok)` is called on the Tk thread once the send finished.
         """
         if not HAS_OUTLOOK:
             logger.debug("Outlook not available; cannot send reminder email.")
-            return False
-
-        try:
-            ol_app = win32com.client.Dispatch("Outlook.Application")
-            ns = ol_app.GetNamespace("MAPI")
-        except Exception:
-            logger.exception("Failed to initialize Outlook COM objects")
-            return False
+            if on_done is not None:
+                on_done(False)
+            return
 
         # Normalize subject: keep exactly the conversation subject you want threaded
         conv_subject = (subject_title or "Reminder").strip()
 
-        # Attempt to read stored reminder EntryID
+        # Attempt to read stored reminder EntryID (the worker must not use the db)
         entry_id = None
         try:
             if task_id:
-                cur = self.db.conn.cursor()
-                cur.execute("SELECT reminder_mail_entryid FROM tasks WHERE id=?", (task_id,))
-                row = cur.fetchone()
+                row = self.db.get_fields(task_id, "reminder_mail_entryid")
                 if row and row["reminder_mail_entryid"]:
                     entry_id = row["reminder_mail_entryid"]
         except Exception:
             logger.exception("Could not read reminder_mail_entryid")
 
+        def _finished(eid):
+            ok = eid is not None
+            # Store EntryID on the task for future replies (if we have a real task row)
+            if eid and task_id:
+                try:
+                    self.db.set_reminder_mail_entryid(task_id, eid)
+                except Exception:
+                    logger.exception("Failed to store reminder_mail_entryid")
+            if on_done is not None:
+                on_done(ok)
+
+        self._outlook_submit(
+            lambda ol_app, ns: self._deliver_reminder_mail(ol_app, ns, entry_id, to_address, conv_subject, html_body, task_id),
+            _finished,
+        )
+
+    def _deliver_reminder_mail(self, ol_app, ns, entry_id, to_address, conv_subject, html_body, task_id=None):
+        """
+        Outlook side of _send_reminder_email; runs on the worker thread.
+        Returns the sent mail's EntryID ("" if Outlook doesn't expose one), or None on failure.
+        """
         # Helper to get signature HTML using a probe item (best-effort)
         def _get_signature():
             try:
@@ -3572,20 +4360,12 @@ class TaskApp(tk.Tk):
                         reply.Body = (html_body or "") + "\n\n" + (reply.Body or "")
                     reply.Send()
 
+                    logger.info("Replied to existing reminder mail for task %s -> %s", task_id, to_address)
                     # After sending a reply, EntryID might change (a sent item has an EntryID).
                     try:
-                        new_eid = getattr(reply, "EntryID", None)
-                        if new_eid and task_id:
-                            try:
-                                self.db.conn.execute("UPDATE tasks SET reminder_mail_entryid=? WHERE id=?", (new_eid, task_id))
-                                self.db.conn.commit()
-                            except Exception:
-                                logger.exception("Could not update reminder_mail_entryid after reply")
+                        return getattr(reply, "EntryID", None) or ""
                     except Exception:
-                        pass
-
-                    logger.info("Replied to existing reminder mail for task %s -> %s", task_id, to_address)
-                    return True
+                        return ""
                 except Exception:
                     logger.exception("Failed to reply to existing mail; will fallback to creating a new mail")
                     # fall through to create new mail
@@ -3620,107 +4400,163 @@ class TaskApp(tk.Tk):
                     mail.Send()
                 except Exception:
                     logger.exception("Failed to send new reminder mail")
-                    return False
+                    return None
 
-            # Store EntryID on the task for future replies (if we have a real task row)
+            logger.info("Sent new reminder mail to %s for task %s (subject=%s)", to_address, task_id, conv_subject)
             try:
-                eid = getattr(mail, "EntryID", None)
-                if eid and task_id:
-                    try:
-                        self.db.conn.execute("UPDATE tasks SET reminder_mail_entryid=? WHERE id=?", (eid, task_id))
-                        self.db.conn.commit()
-                    except Exception:
-                        logger.exception("Failed to store reminder_mail_entryid")
+                return getattr(mail, "EntryID", None) or ""
             except Exception:
-                pass
-
-            logger.info("Sent new reminder mail to %s for task %s (subject=%s)", to_address, task_id, conv_subject)
-            return True
+                return ""
 
         except Exception:
             logger.exception("Failed to create/send Outlook mail")
-            return False
+            return None
     ###
-    def _get_flagged_from_folder(self, folder, flagged):
+    # DASL filter on PR_FLAG_STATUS (0x1090) = 2 (flagged)
+    _FLAGGED_DASL = '@SQL="http://schemas.microsoft.com/mapi/proptag/0x10900003" = 2'
+
+    def _flagged_mail_entry(self, item, subject, entry_id, store_id, sender, received, known_ids, session=None):
         """
-        Safely fetch flagged mails from a folder.
-        Skips digitally signed / receipt-request emails that Outlook blocks in COM.
+        Build the import dict for one flagged mail. The body and attachments are
+        only read (and attachments saved) for mails not imported before; when
+        `item` is None it is opened through `session` only in that case.
         """
-        try:
-            items = folder.Items
-            items.Sort("[ReceivedTime]", True)
-
+        description = ""
+        attachments = []
+        if entry_id not in known_ids:
+            if item is None:
+                item = session.GetItemFromID(entry_id, store_id)
+            # --- PROTECTED access (wrap individually) ---
+            try:
+                description = item.HTMLBody or ""
+            except Exception:
+                logger.warning("HTMLBody blocked for signed email: %s", subject)
             try:
-                flagged_items = items.Restrict("[FlagStatus] = 2")
+                # snapshot names first; the attachments dir is created once per scan
+                for name, att in [(a.FileName, a) for a in item.Attachments]:
+                    try:
+                        fname = os.path.join("attachments", name)
+                        att.SaveAsFile(fname)
+                        attachments.append(fname)
+                    except Exception:
+                        logger.warning("Attachment blocked: %s", name)
             except Exception:
-                flagged_items = items
+                logger.warning("Attachments blocked for signed email: %s", subject)
+        return {
+            "title": f"[Mail] {subject}",
+            "description": description,
+            "due_date": None,
+            "priority": "Medium",
+            "status": "Pending",
+            "outlook_id": entry_id,
+            "outlook_storeid": store_id,
+            "outlook_received_time": received,
+            "outlook_sender": sender,
+            "attachments": json.dumps(attachments)
+        }
 
-            for item in flagged_items:
+    def _scan_flagged_table(self, folder, known_ids):
+        """
+        Read flagged mails through folder.GetTable: the filter and the metadata
+        columns come back in bulk instead of one COM call per item property.
+        """
+        found = []
+        store_id = folder.StoreID
+        session = folder.Session
+        table = folder.GetTable(self._FLAGGED_DASL, 0)  # 0 = olUserItems
+        table.Columns.RemoveAll()
+        for col in ("EntryID", "Subject", "MessageClass", "SenderEmailAddress", "ReceivedTime"):
+            table.Columns.Add(col)
+        table.Sort("[ReceivedTime]", True)
+        while not table.EndOfTable:
+            row = table.GetNextRow()
+            try:
+                # IPM.Note* == MailItem (Class 43), including signed mail
+                if not str(row.Item("MessageClass") or "").startswith("IPM.Note"):
+                    continue
+                subject = row.Item("Subject")
                 try:
-                    if getattr(item, "Class", None) != 43:  # MailItem
-                        continue
+                    received = row.Item("ReceivedTime").strftime("%Y-%m-%d %H:%M:%S")
+                except Exception:
+                    received = None
+                found.append(self._flagged_mail_entry(
+                    None, subject, row.Item("EntryID"), store_id,
+                    row.Item("SenderEmailAddress"), received, known_ids, session))
+            except Exception:
+                logger.exception("Skipping restricted Outlook mail item")
+        return found
 
-                    # --- SAFE metadata (always allowed) ---
-                    subject = item.Subject
-                    entry_id = item.EntryID
-                    sender = getattr(item, "SenderEmailAddress", None)
+    def _scan_flagged_items(self, folder, known_ids):
+        """Fallback scan via Items.Restrict when GetTable isn't usable."""
+        found = []
+        items = folder.Items
+        items.Sort("[ReceivedTime]", True)
 
-                    try:
-                        received = item.ReceivedTime.strftime("%Y-%m-%d %H:%M:%S")
-                    except Exception:
-                        received = None
+        try:
+            flagged_items = items.Restrict("[FlagStatus] = 2")
+        except Exception:
+            flagged_items = items
 
-                    # --- PROTECTED access (wrap individually) ---
-                    description = ""
-                    try:
-                        description = item.HTMLBody or ""
-                    except Exception:
-                        logger.warning("HTMLBody blocked for signed email: %s", subject)
+        for item in flagged_items:
+            try:
+                if getattr(item, "Class", None) != 43:  # MailItem
+                    continue
 
-                    attachments = []
-                    try:
-                        if item.Attachments.Count > 0:
-                            os.makedirs("attachments", exist_ok=True)
-                            for att in item.Attachments:
-                                try:
-                                    fname = os.path.join("attachments", att.FileName)
-                                    att.SaveAsFile(fname)
-                                    attachments.append(fname)
-                                except Exception:
-                                    logger.warning("Attachment blocked: %s", att.FileName)
-                    except Exception:
-                        logger.warning("Attachments blocked for signed email: %s", subject)
-
-                    flagged.append({
-                        "title": f"[Mail] {subject}",
-                        "description": description,
-                        "due_date": None,
-                        "priority": "Medium",
-                        "status": "Pending",
-                        "outlook_id": entry_id,
-                        "outlook_storeid": item.Parent.StoreID,
-                        "outlook_received_time": received,
-                        "outlook_sender": sender,
-                        "attachments": json.dumps(attachments)
-                    })
+                # --- SAFE metadata (always allowed) ---
+                subject = item.Subject
+                entry_id = item.EntryID
+                sender = getattr(item, "SenderEmailAddress", None)
 
+                try:
+                    received = item.ReceivedTime.strftime("%Y-%m-%d %H:%M:%S")
                 except Exception:
-                    logger.exception("Skipping restricted Outlook mail item")
-                    continue
+                    received = None
+
+                found.append(self._flagged_mail_entry(
+                    item, subject, entry_id, item.Parent.StoreID, sender, received, known_ids))
+
+            except Exception:
+                logger.exception("Skipping restricted Outlook mail item")
+                continue
+        return found
+
+    def _get_flagged_from_folder(self, folder, flagged, known_ids=frozenset()):
+        """
+        Safely fetch flagged mails from a folder and its subfolders.
+        Skips digitally signed / receipt-request emails that Outlook blocks in COM.
+        `known_ids` are EntryIDs already in the DB; their bodies/attachments are not read.
+        """
+        try:
+            try:
+                found = self._scan_flagged_table(folder, known_ids)
+            except Exception:
+                logger.warning("GetTable scan failed for folder; falling back to Items.Restrict")
+                found = self._scan_flagged_items(folder, known_ids)
+            flagged.extend(found)
 
             # recurse into subfolders
             for sub in folder.Folders:
-                self._get_flagged_from_folder(sub, flagged)
+                self._get_flagged_from_folder(sub, flagged, known_ids)
 
         except Exception:
             logger.exception("Error scanning Outlook folder")
 
-    def _get_flagged_emails(self):
+    def _get_flagged_emails(self, ns=None, known_ids=frozenset()):
+        """
+        Collect flagged mails from the To-Do list, Inbox tree and 'For Follow Up'.
+        Pass `ns` when calling from a worker thread: COM objects belong to the
+        thread that created them, so the cached main-thread namespace can't be used.
+        `known_ids` (EntryIDs already imported) skips body/attachment reads for those.
+        """
         if not HAS_OUTLOOK:
             return []
         flagged = []
         try:
-            outlook = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
+            os.makedirs("attachments", exist_ok=True)
+        except Exception:
+            logger.exception("Could not create attachments folder")
+        try:
+            outlook = ns if ns is not None else self._outlook_ns()
             try:
                 todo_folder = outlook.GetDefaultFolder(28)
                 for item in todo_folder.Items:
@@ -3730,18 +4566,19 @@ class TaskApp(tk.Tk):
                             due = item.DueDate.strftime("%Y-%m-%d") if getattr(item, "DueDate", None) else None
                         except Exception:
                             due = None
-                        desc = getattr(item, "HTMLBody", "") or getattr(item, "Body", "")
+                        entry_id = item.EntryID
+                        desc = ""
                         attachments = []
-
-                        try:
-                            if item.Attachments.Count > 0:
-                                os.makedirs("attachments", exist_ok=True)
-                                for att in item.Attachments:
-                                    fname = os.path.join("attachments", att.FileName)
+                        # already imported: skip the body read and attachment re-save
+                        if entry_id not in known_ids:
+                            desc = getattr(item, "HTMLBody", "") or getattr(item, "Body", "")
+                            try:
+                                for name, att in [(a.FileName, a) for a in item.Attachments]:
+                                    fname = os.path.join("attachments", name)
                                     att.SaveAsFile(fname)
                                     attachments.append(fname)
-                        except Exception:
-                            pass
+                            except Exception:
+                                pass
 
                         flagged.append({
                             "title": f"[Mail] {item.Subject}",
@@ -3749,7 +4586,7 @@ class TaskApp(tk.Tk):
                             "due_date": due,
                             "priority": "Medium",
                             "status": "Pending",
-                            "outlook_id": item.EntryID,
+                            "outlook_id": entry_id,
                             "outlook_storeid": item.Parent.StoreID,
                             "outlook_received_time": item.ReceivedTime.strftime("%Y-%m-%d %H:%M:%S"),
                             "outlook_sender": item.SenderEmailAddress,
@@ -3760,7 +4597,7 @@ class TaskApp(tk.Tk):
 
             try:
                 inbox = outlook.GetDefaultFolder(6)
-                self._get_flagged_from_folder(inbox, flagged)
+                self._get_flagged_from_folder(inbox, flagged, known_ids)
             except Exception:
                 logger.exception("Inbox flagged mail fetch error")
 
@@ -3768,65 +4605,118 @@ class TaskApp(tk.Tk):
                 search_root = outlook.GetDefaultFolder(23)
                 for folder in search_root.Folders:
                     if folder.Name.lower() == "for follow up":
-                        self._get_flagged_from_folder(folder, flagged)
+                        self._get_flagged_from_folder(folder, flagged, known_ids)
             except Exception:
                 logger.exception("Search folder fetch error")
         except Exception:
             logger.exception("Outlook fetch error")
         return flagged
 
-    def _import_outlook_flags(self):
+    def _import_outlook_flags(self, quiet=False):
         """
         Import flagged Outlook emails and tasks.
-        Prevents duplicates even if EntryID changes.
+        The COM scan runs on a worker thread; the DB work and dialogs happen in
+        _apply_flagged back on the Tk thread. quiet=True (timer runs) logs the
+        result instead of showing dialogs.
         """
-        flagged = self._get_flagged_emails()
+        if not HAS_OUTLOOK:
+            self._apply_flagged([], quiet)
+            return
+        if self._outlook_fetch_running:
+            logger.info("Outlook fetch already in progress; skipping")
+            return
+        try:
+            known_ids = self.db.get_outlook_ids()
+        except Exception:
+            logger.exception("Could not load imported Outlook ids")
+            known_ids = frozenset()
+        self._outlook_fetch_running = True
+        results = queue.Queue()
+
+        def worker():
+            flagged = []
+            try:
+                import pythoncom  # type: ignore
+                pythoncom.CoInitialize()
+                ns = None
+                try:
+                    ns = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
+                    flagged = self._get_flagged_emails(ns, known_ids)
+                finally:
+                    ns = None
+                    pythoncom.CoUninitialize()
+            except Exception:
+                logger.exception("Outlook fetch worker failed")
+            results.put(flagged)
+
+        def poll():
+            try:
+                flagged = results.get_nowait()
+            except queue.Empty:
+                self.after(200, poll)
+                return
+            self._outlook_fetch_running = False
+            self._apply_flagged(flagged, quiet)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(200, poll)
 
+    def _apply_flagged(self, flagged, quiet=False):
+        """
+        Insert fetched flagged items, skipping ones already imported.
+        Prevents duplicates even if EntryID changes.
+        """
         logger.info("Outlook flagged emails found: %d", len(flagged))
 
         if not flagged:
-            messagebox.showinfo("Outlook", "No flagged emails or tasks found.")
+            if not quiet:
+                messagebox.showinfo("Outlook", "No flagged emails or tasks found.")
             return
 
-        cur = self.db.conn.cursor()
         new_items = []
-
-        for f in flagged:
-            try:
-                exists = cur.execute(
-                    """
-                    SELECT 1 FROM tasks
-                    WHERE outlook_id = ?
-                    OR lower(title) = lower(?)
-                    """,
-                    (f["outlook_id"], f["title"])
-                ).fetchone()
-
-                if not exists:
-                    new_items.append(f)
-
-            except Exception:
-                logger.exception("Duplicate check failed for Outlook item")
+        try:
+            existing_ids, existing_titles = self.db.find_existing_outlook_keys(
+                [f.get("outlook_id") for f in flagged],
+                [f.get("title") for f in flagged],
+            )
+            for f in flagged:
+                if f.get("outlook_id") and f["outlook_id"] in existing_ids:
+                    continue
+                # SQLite's lower() only folds ASCII; match it exactly
+                if f.get("title") and f["title"].translate(_ASCII_LOWER) in existing_titles:
+                    continue
+                new_items.append(f)
+        except Exception:
+            logger.exception("Duplicate check failed for Outlook items")
 
         logger.info("New Outlook tasks to import: %d", len(new_items))
 
         if new_items:
             self.db.bulk_add(new_items)
-            self._populate()
-            self._populate_kanban()
+            self._request_refresh()
 
-        messagebox.showinfo(
-            "Outlook Import",
-            f"Imported {len(new_items)} new task(s).\n"
-            f"Skipped {len(flagged) - len(new_items)} existing item(s)."
-        )
+        if not quiet:
+            messagebox.showinfo(
+                "Outlook Import",
+                f"Imported {len(new_items)} new task(s).\n"
+                f"Skipped {len(flagged) - len(new_items)} existing item(s)."
+            )
 
-    def _refresh_outlook_flags(self):
-        self._import_outlook_flags()
+    def _refresh_outlook_flags(self, quiet=False):
+        # re-arm first so a skipped or failed fetch doesn't stop the timer
+        self._schedule_outlook_refresh(self.settings.get("outlook_refresh_minutes", 30))
+        self._import_outlook_flags(quiet=quiet)
 
     def _schedule_outlook_refresh(self, minutes):
+        # keep a single pending refresh; timer runs re-arm before fetching
+        try:
+            if self._outlook_refresh_after_id:
+                self.after_cancel(self._outlook_refresh_after_id)
+        except Exception:
+            pass
         try:
-            self.after(minutes * 60 * 1000, self._refresh_outlook_flags)
+            self._outlook_refresh_after_id = self.after(
+                minutes * 60 * 1000, lambda: self._refresh_outlook_flags(quiet=True))
         except Exception:
             pass
 
@@ -3834,28 +4724,17 @@ class TaskApp(tk.Tk):
         if not HAS_OUTLOOK:
             return
         try:
-            outlook = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
-            cur = self.db.conn.cursor()
-            cur.execute("SELECT outlook_id FROM tasks WHERE id=?", (task_id,))
-            row = cur.fetchone()
+            outlook = self._outlook_ns()
+            row = self.db.get_fields(task_id, "outlook_id", "outlook_storeid")
             if not row or not row["outlook_id"]:
                 return
             entryid = row["outlook_id"]
-            item = None
+            storeid = row["outlook_storeid"]
+            # direct MAPI lookup by EntryID instead of walking folder items
             try:
-                todo_folder = outlook.GetDefaultFolder(28)
-                for i in todo_folder.Items:
-                    if i.EntryID == entryid:
-                        item = i
-                        break
+                item = outlook.GetItemFromID(entryid, storeid) if storeid else outlook.GetItemFromID(entryid)
             except Exception:
-                pass
-            if not item:
-                try:
-                    inbox = outlook.GetDefaultFolder(6)
-                    item = inbox.Items.Find(f"[EntryID] = '{entryid}'")
-                except Exception:
-                    pass
+                item = None
             if not item:
                 return
             if action == "done" or (action == "update" and data.get("status") == "Done"):
@@ -3872,43 +4751,47 @@ class TaskApp(tk.Tk):
 
     # -------------------- CSV / Contacts --------------------
     def _import_csv(self):
+        from tkinter import filedialog
         path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
         if not path:
             return
-        rows = []
         try:
             with open(path, newline="", encoding="utf-8-sig") as f:
                 reader = csv.DictReader(f)
-                for r in reader:
-                    if not r.get("title"):
-                        continue
-                    rows.append({"title": r["title"], "description": r.get("description", ""), "due_date": r.get("due_date"),
-                                 "priority": r.get("priority", "Medium"), "status": r.get("status", "Pending")})
-            if rows:
-                self.db.bulk_add(rows)
-                self._populate(); self._populate_kanban()
-                messagebox.showinfo("CSV Import", f"Imported {len(rows)} tasks.")
+                # streamed straight into bulk_add's batched, single-transaction insert
+                rows = (
+                    {"title": r["title"], "description": r.get("description", ""), "due_date": r.get("due_date"),
+                     "priority": r.get("priority", "Medium"), "status": r.get("status", "Pending")}
+                    for r in reader if r.get("title")
+                )
+                added = self.db.bulk_add(rows)
+            if added:
+                self._request_refresh()
+                messagebox.showinfo("CSV Import", f"Imported {added} tasks.")
         except Exception:
             logger.exception("CSV import failed")
             messagebox.showerror("CSV Import", "Failed to import CSV")
 
     def _export_csv(self):
+        from tkinter import filedialog
         path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
         if not path:
             return
-        rows = self.db.fetch()
         try:
+            count = 0
             with open(path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 writer.writerow(["title", "description", "due_date", "priority", "status"])
-                for r in rows:
-                    writer.writerow([r["title"], r["description"], r["due_date"], r["priority"], r["status"]])
-            messagebox.showinfo("CSV Export", f"Exported {len(rows)} tasks.")
+                for r in self.db.fetch_iter():
+                    writer.writerow(r)
+                    count += 1
+            messagebox.showinfo("CSV Export", f"Exported {count} tasks.")
         except Exception:
             logger.exception("CSV export failed")
             messagebox.showerror("CSV Export", "Export failed")
 
     def _import_contacts(self):
+        from tkinter import filedialog
         path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx;*.xls"), ("CSV files", "*.csv")])
         if not path:
             return
@@ -3927,17 +4810,15 @@ class TaskApp(tk.Tk):
         if not self.kanban_selected_id:
             messagebox.showwarning("No Task", "Please select a task in Kanban first.")
             return
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT * FROM tasks WHERE id=?", (self.kanban_selected_id,))
-        r = cur.fetchone()
+        r = self.db.get_fields(self.kanban_selected_id, "outlook_id")
         if not r:
             return
         if r["outlook_id"]:
             messagebox.showinfo("Info", "Outlook tasks cannot be edited here. Update directly in Outlook.")
             return
         new_desc = self.kanban_text.get("1.0", tk.END).strip()
-        self.db.update(self.kanban_selected_id, r["title"], new_desc, r["due_date"], r["priority"], r["status"])
-        self._populate(); self._populate_kanban()
+        self.db.update_description(self.kanban_selected_id, new_desc)
+        self._request_refresh()
         self._sync_outlook_task(self.kanban_selected_id, {"desc": new_desc}, action="update")
         messagebox.showinfo("Saved", "Description updated successfully.")
 
@@ -4010,47 +4891,33 @@ class TaskApp(tk.Tk):
 
     # -------------------- Trash / Delete / Restore --------------------
     def _populate_trash(self):
+        if getattr(self, "trash_tree", None) is None:
+            # Trash tab not built yet; it is populated when first shown
+            return
+        if self._tab_hidden(self.trash_tab):
+            return
         try:
-            for iid in getattr(self, "trash_tree", tk.Frame()).get_children():
-                self.trash_tree.delete(iid)
+            # one Tcl call for all rows instead of one per row
+            self.trash_tree.delete(*self.trash_tree.get_children())
         except Exception:
             pass
+        # same global filters as the other tabs, applied in SQL; Trash keeps
+        # completed tasks regardless of "Show Completed"
+        filters = self._current_filters()
+        filters.pop("show_completed", None)
         try:
-            rows = self.db.fetch_deleted()
+            rows = self.db.fetch_deleted(**filters)
         except Exception:
             rows = []
 
-        # Apply same global filters to Trash view
-        ft = (self.filter_text_var.get().strip().lower() if hasattr(self, "filter_text_var") else "").strip()
-        fpri = (self.filter_priority_var.get() if hasattr(self, "filter_priority_var") else "All")
-        fstat = (self.filter_status_var.get() if hasattr(self, "filter_status_var") else "All")
-        fdue = (self.filter_due_var.get().strip() if hasattr(self, "filter_due_var") else "").strip()
-
-        def _trash_row_matches(r):
-            if ft:
-                hay = ((r["title"] or "") + " " + (r["title"] or "")).lower()
-                if ft not in hay:
-                    return False
-            if fpri and fpri != "All":
-                if (r["priority"] or "") != fpri:
-                    return False
-            if fstat and fstat != "All":
-                if (r["status"] or "") != fstat:
-                    return False
-            if fdue:
-                try:
-                    if (r["due_date"] or "") != fdue:
-                        return False
-                except Exception:
-                    return False
-            return True
-
-        rows = [r for r in rows if _trash_row_matches(r)]
-
-        for r in rows:
+        values = [
+            (r["id"], r["title"], r["deleted_at"] or "?", r["due_date"] or "—", r["priority"], r["status"])
+            for r in rows
+        ]
+        insert = self.trash_tree.insert
+        for vals in values:
             try:
-                deleted_at = r["deleted_at"] or "?"
-                self.trash_tree.insert("", tk.END, values=(r["id"], r["title"], deleted_at, r["due_date"] or "—", r["priority"], r["status"]))
+                insert("", tk.END, values=vals)
             except Exception:
                 pass
 
@@ -4058,14 +4925,17 @@ class TaskApp(tk.Tk):
         sel = self.trash_tree.selection()
         if not sel:
             return
+        task_ids = []
         for s in sel:
             try:
-                task_id = int(self.trash_tree.item(s, "values")[0])
-                self.db.restore(task_id)
+                task_ids.append(int(self.trash_tree.item(s, "values")[0]))
             except Exception:
                 logger.exception("Restore error")
-        self._populate()
-        self._populate_kanban()
+        try:
+            self.db.restore_many(task_ids)
+        except Exception:
+            logger.exception("Restore error")
+        self._request_refresh()
         self._populate_trash()
 
     def _permanently_delete_selected_trash(self):
@@ -4075,13 +4945,12 @@ class TaskApp(tk.Tk):
         confirm = messagebox.askyesno("Confirm Permanent Delete", f"Permanently delete {len(sel)} selected item(s)? This cannot be undone.")
         if not confirm:
             return
+        task_ids = []
         for s in sel:
             try:
                 task_id = int(self.trash_tree.item(s, "values")[0])
                 try:
-                    cur = self.db.conn.cursor()
-                    cur.execute("SELECT outlook_id FROM tasks WHERE id=?", (task_id,))
-                    row = cur.fetchone()
+                    row = self.db.get_fields(task_id, "outlook_id")
                     if row and row["outlook_id"]:
                         try:
                             self._sync_outlook_task(task_id, {}, action="delete")
@@ -4089,11 +4958,14 @@ class TaskApp(tk.Tk):
                             pass
                 except Exception:
                     pass
-                self.db.delete(task_id)
+                task_ids.append(task_id)
             except Exception:
                 logger.exception("Permanent delete error")
-        self._populate()
-        self._populate_kanban()
+        try:
+            self.db.delete_many(task_ids)
+        except Exception:
+            logger.exception("Permanent delete error")
+        self._request_refresh()
         self._populate_trash()
 
     def _empty_trash_confirm(self):
@@ -4114,8 +4986,7 @@ class TaskApp(tk.Tk):
             self.db.purge_deleted()
         except Exception:
             logger.exception("Empty trash error")
-        self._populate()
-        self._populate_kanban()
+        self._request_refresh()
         self._populate_trash()
 
     def _delete_task(self):
@@ -4125,14 +4996,17 @@ class TaskApp(tk.Tk):
         confirm = messagebox.askyesno("Confirm Delete", f"Move {len(sel)} selected task(s) to Trash?")
         if not confirm:
             return
+        task_ids = []
         for s in sel:
             try:
-                task_id = int(self.tree.item(s, "values")[0])
-                self.db.soft_delete(task_id)
+                task_ids.append(int(self.tree.item(s, "values")[0]))
             except Exception:
                 logger.exception("Soft-delete error")
-        self._populate()
-        self._populate_kanban()
+        try:
+            self.db.soft_delete_many(task_ids)
+        except Exception:
+            logger.exception("Soft-delete error")
+        self._request_refresh()
         try:
             self._populate_trash()
         except Exception:
@@ -4147,35 +5021,47 @@ class TaskApp(tk.Tk):
                 task_id = int(self.tree.item(s, "values")[0])
             except Exception:
                 continue
-            cur = self.db.conn.cursor()
-            cur.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
-            row = cur.fetchone()
-            if not row:
+            row = self._recurring_row_for_done(task_id)
+            if row is False:
                 continue
             self.db.mark_done(task_id)
-            try:
-                self._create_next_occurrence_if_needed(row)
-            except Exception:
-                pass
+            if row is not None:
+                try:
+                    self._create_next_occurrence_if_needed(row)
+                except Exception:
+                    pass
             self._sync_outlook_task(task_id, {}, action="done")
-        self._populate(); self._populate_kanban()
+        self._request_refresh()
 
     def _mark_done_selected_kanban(self):
         if not self.kanban_selected_id:
             return
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT * FROM tasks WHERE id=?", (self.kanban_selected_id,))
-        row = cur.fetchone()
-        if not row:
+        row = self._recurring_row_for_done(self.kanban_selected_id)
+        if row is False:
             return
         self.db.mark_done(self.kanban_selected_id)
-        try:
-            self._create_next_occurrence_if_needed(row)
-        except Exception:
-            pass
-        self._populate(); self._populate_kanban()
+        if row is not None:
+            try:
+                self._create_next_occurrence_if_needed(row)
+            except Exception:
+                pass
+        self._request_refresh()
         self._sync_outlook_task(self.kanban_selected_id, {}, action="done")
 
+    def _recurring_row_for_done(self, task_id):
+        """
+        Before marking a task done: return False if it doesn't exist, None if it
+        has no active recurrence, else the full row for _create_next_occurrence_if_needed.
+        Only recurring tasks pay for loading description/progress/attachments.
+        """
+        r = self.db.get_fields(task_id, "recurrence", "due_date")
+        if not r:
+            return False
+        rec = (r["recurrence"] or "").strip().lower()
+        if not r["due_date"] or rec in ("", "none"):
+            return None
+        return self.db.get_task(task_id)
+
     def _create_next_occurrence_if_needed(self, task_row):
         try:
             rec = (task_row["recurrence"] or "none")
@@ -4187,9 +5073,8 @@ class TaskApp(tk.Tk):
             next_due = self._compute_next_due(due, rec)
             if not next_due:
                 return None
-            attachments = task_row["attachments"] or None
-            progress = task_row["progress_log"] or None
-            self.db.add(
+            # attachments and progress ride along in the INSERT; add() returns the new id
+            return self.db.add(
                 title=task_row["title"],
                 description=task_row["description"],
                 due_date=next_due,
@@ -4198,16 +5083,10 @@ class TaskApp(tk.Tk):
                 outlook_id=None,
                 reminder_minutes=task_row["reminder_minutes"],
                 reminder_set_at=None,
-                recurrence=rec
+                recurrence=rec,
+                attachments=task_row["attachments"] or None,
+                progress_log=task_row["progress_log"] or None,
             )
-            cur = self.db.conn.cursor()
-            cur.execute("SELECT last_insert_rowid() as id")
-            new_id = cur.fetchone()["id"]
-            if attachments:
-                self.db.conn.execute("UPDATE tasks SET attachments=? WHERE id=?", (attachments, new_id))
-            if progress:
-                self.db.update_progress(new_id, progress)
-            return new_id
         except Exception:
             logger.exception("Error creating next recurrence")
             return None
@@ -4220,16 +5099,7 @@ class TaskApp(tk.Tk):
             return
         vals = self.tree.item(sel[0], "values")
         task_id = int(vals[0])
-        cur = self.db.conn.cursor()
-        cur.execute("SELECT attachments FROM tasks WHERE id=?", (task_id,))
-        row = cur.fetchone()
-        if row and row["attachments"]:
-            try:
-                files = json.loads(row["attachments"])
-            except Exception:
-                files = []
-        else:
-            files = []
+        files = self.db.get_attachments(task_id)
         if hasattr(self, "attachments_var"):
             try:
                 self.attachments_var.set(", ".join(os.path.basename(f) for f in files))
@@ -4261,15 +5131,16 @@ class TaskApp(tk.Tk):
         else:
             self._delete_task()
 
-    def _treeview_sort_column(self, col, reverse):
-        l = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-        try:
-            l.sort(key=lambda t: datetime.strptime(t[0], "%Y-%m-%d"), reverse=reverse)
-        except Exception:
-            l.sort(reverse=reverse)
-        for index, (val, k) in enumerate(l):
-            self.tree.move(k, "", index)
-        self.tree.heading(col, command=lambda: self._treeview_sort_column(col, not reverse))
+    def _sql_sort(self, col):
+        """
+        Sort the Task List by a heading. The ordering is done by SQLite in
+        TaskDB.fetch() and kept across refreshes; clicking the same heading
+        again flips the direction.
+        """
+        desc = not self._sort_state.get(col, False) if col == self._sort_col else False
+        self._sort_state[col] = desc
+        self._sort_col = col
+        self._populate()
 
     def _check_reminders(self):
         due_today = self.db.fetch_due_today()
@@ -4278,12 +5149,19 @@ class TaskApp(tk.Tk):
         self.after(3600 * 1000, self._check_reminders)
 
     def _on_exit(self):
+        # don't lose snoozes/dismissals clicked just before closing
+        if getattr(self, "_reminder_flush_id", None) is not None:
+            try:
+                self.after_cancel(self._reminder_flush_id)
+            except Exception:
+                pass
+            try:
+                self._flush_reminder_updates()
+            except Exception:
+                logger.exception("Error flushing reminder updates on exit")
         try:
             if hasattr(self, "db") and getattr(self.db, "conn", None):
-                try:
-                    self.db.conn.close()
-                except Exception:
-                    pass
+                self.db.close()
         except Exception:
             pass
         try: